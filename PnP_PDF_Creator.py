@@ -45,11 +45,18 @@ import codecs
 import textwrap
 import tempfile
 import hashlib
+import struct
+import math
 import sys
+import time
 import configparser
 import platform
 import argparse
 import io
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from os.path import expanduser
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
@@ -59,28 +66,32 @@ from reportlab.lib.pagesizes import A4, letter, landscape
 from reportlab.lib.utils import ImageReader
 from reportlab.lib.colors import Color, HexColor, black
 from reportlab.lib import colors
+from reportlab import rl_config
+
+# Bild- und Seitenstreams binär (nur Flate) statt ASCII85 schreiben: ReportLab kodiert
+# A85 in reinem Python, das kostete bei großen Decks den Großteil der PDF-Zeit und
+# bläht jeden Stream um 25 % auf. Der Inhalt des PDFs ist identisch.
+rl_config.useA85 = 0
 
 try:
     from PIL import Image
 except ImportError:
     Image = None
 
-try:
-    import questionary  # optionale Komfort-Listenprompts
-except Exception:
-    questionary = None
 try:
     # Rich erzwingen (auch in PyInstaller-EXE ohne "volles" Terminal)
     from rich.console import Console
     from rich.panel import Panel
     from rich.table import Table
     from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+    from rich.markup import escape as _rich_markup_escape
     _FORCE_RICH = True
 except Exception:
     Console = None  # type: ignore
     Panel = None    # type: ignore
     Table = None    # type: ignore
     Progress = None # type: ignore
+    _rich_markup_escape = None  # type: ignore
     BarColumn = TextColumn = TimeRemainingColumn = None  # type: ignore
     _FORCE_RICH = False
 
@@ -91,13 +102,19 @@ except Exception:
 os.environ.setdefault("PROMPT_TOOLKIT_COLOR_DEPTH", "DEPTH_24_BIT")
 os.environ.setdefault("PROMPT_TOOLKIT_FORCE_TERMINAL", "1")
 
-try:
-    if hasattr(sys.stdout, "buffer"):
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-    if hasattr(sys.stderr, "buffer"):
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
-except Exception:
-    pass
+# Nur umstellen, wenn der Stream nicht schon UTF-8 ist; bevorzugt per reconfigure(),
+# damit Puffer/Zeilenpufferung des Original-Streams erhalten bleiben (kein zweiter Wrapper).
+for _name in ("stdout", "stderr"):
+    try:
+        _stream = getattr(sys, _name)
+        if (getattr(_stream, "encoding", "") or "").lower().replace("-", "") == "utf8":
+            continue
+        if hasattr(_stream, "reconfigure"):
+            _stream.reconfigure(encoding="utf-8", errors="replace")
+        elif hasattr(_stream, "buffer"):
+            setattr(sys, _name, io.TextIOWrapper(_stream.buffer, encoding="utf-8", errors="replace"))
+    except Exception:
+        pass
 
 # Rich-Konsole initialisieren oder auf None setzen
 console = Console(force_terminal=True, color_system="auto") if _FORCE_RICH and Console else None
@@ -113,6 +130,14 @@ _PAUSE_ALREADY_SHOWN = False
 # =========================================================
 SCRIPT_VERSION = 'V1.4-2026-03-09'
 DEBUG_PREPROCESS = False  # set True to print per-image crop/resize diagnostics
+# Vorbereitete Karten (auch verlustbehaftete JPEGs) über Läufe hinweg in TMP_DIR behalten.
+# --no-cache: aus -> JPEGs bleiben nur im Speicher (_MEM_JPEG), TMP_DIR wird beim Start geleert.
+KEEP_PREPROCESS_CACHE = True
+PREPROCESS_CACHE_MAX_AGE_DAYS = 30  # länger unbenutzte Cache-Dateien werden beim Start entfernt
+# Version des Vorverarbeitungs-ABLAUFS im Cache-Schlüssel. Parameter (JPEG-Optionen, Qualitäts-
+# Presets, Resampling-Filter, Bleed-/Innenmaße) stecken automatisch im Schlüssel (siehe
+# _preprocess_output_sig); erhöhen nur, wenn sich die Logik selbst ändert (neuer Crop-Weg o. ä.).
+_CACHE_FORMAT = 3
 
 # =========================================================
 # Quality presets (Cards only)
@@ -143,6 +168,9 @@ RULEBOOK_ROTATE_MODE = DEFAULT_RULEBOOK_ROTATE_MODE
 TEMPLATE_DPI = 300
 BLEED_IN_PER_SIDE = 0.125  # 1/8"
 MM_PER_INCH = 25.4
+# Umrechnungsfaktoren einmal ausrechnen (Division nur hier)
+MM_PER_TEMPLATE_PX = MM_PER_INCH / TEMPLATE_DPI
+PT_PER_MM = 72.0 / MM_PER_INCH
 
 # Zentrale Laufzeit-STATE (vermeidet global/Annotation-Konflikte)
 STATE = {
@@ -167,7 +195,7 @@ def _fmt_to_inner_px(w_mm: float, h_mm: float) -> tuple[int, int]:
 
 def _px_to_mm(px: float) -> float:
     # TEMPLATE_DPI = 300, MM_PER_INCH = 25.4
-    return (px / TEMPLATE_DPI) * MM_PER_INCH
+    return px * MM_PER_TEMPLATE_PX
 
 def apply_card_format(fmt: dict) -> None:
     """Apply selected card format to global geometry variables (format-rein).
@@ -177,7 +205,7 @@ def apply_card_format(fmt: dict) -> None:
     """
     global POKER_W_PT, POKER_H_PT
     global BLEED_W_PX, BLEED_H_PX, INNER_W_PX, INNER_H_PX
-
+    global BLEED_CROP_FRAC, BLEED_CUT_FRAC
 
     w_mm = float(fmt['w_mm'])
     h_mm = float(fmt['h_mm'])
@@ -194,6 +222,8 @@ def apply_card_format(fmt: dict) -> None:
     INNER_H_PX = ih
     BLEED_W_PX = iw + BLEED_LEFT_TOP_PX + BLEED_RIGHT_BOTTOM_PX
     BLEED_H_PX = ih + BLEED_LEFT_TOP_PX + BLEED_RIGHT_BOTTOM_PX
+    BLEED_CROP_FRAC = _bleed_crop_fractions()
+    BLEED_CUT_FRAC = _bleed_cutline_fractions()
     STATE["current_format"] = fmt
 
 def prompt_card_format() -> dict:
@@ -230,7 +260,8 @@ def prompt_card_format() -> dict:
         return fmt
 
 def _mm_str(v: float) -> str:
-    return str(int(v)) if float(v).is_integer() else str(v).rstrip('0').rstrip('.')
+    # %g: 63.0 -> '63', 63.5 -> '63.5' (ein C-Aufruf statt is_integer/str/rstrip)
+    return f"{float(v):g}"
 
 def _mm_str_custom(v: float) -> str:
     # Immer 1 Nachkommastelle
@@ -282,6 +313,20 @@ BLEED_RIGHT_BOTTOM_PX = 38
 INNER_W_PX = BLEED_W_PX - BLEED_LEFT_TOP_PX - BLEED_RIGHT_BOTTOM_PX  # 750
 INNER_H_PX = BLEED_H_PX - BLEED_LEFT_TOP_PX - BLEED_RIGHT_BOTTOM_PX  # 1050
 
+def _bleed_crop_fractions() -> Tuple[float, float, float, float]:
+    """Bleed border as fraction of the bleed canvas: (left, top, right, bottom)."""
+    return (BLEED_LEFT_TOP_PX / BLEED_W_PX, BLEED_LEFT_TOP_PX / BLEED_H_PX,
+            BLEED_RIGHT_BOTTOM_PX / BLEED_W_PX, BLEED_RIGHT_BOTTOM_PX / BLEED_H_PX)
+
+def _bleed_cutline_fractions() -> Tuple[float, float, float, float]:
+    """Poker cutlines within ONE bleed box as fraction of its size: (x_left, x_right, y_bottom, y_top)."""
+    return (BLEED_LEFT_TOP_PX / BLEED_W_PX, (BLEED_LEFT_TOP_PX + INNER_W_PX) / BLEED_W_PX,
+            BLEED_RIGHT_BOTTOM_PX / BLEED_H_PX, (BLEED_RIGHT_BOTTOM_PX + INNER_H_PX) / BLEED_H_PX)
+
+# Werden in apply_card_format() neu berechnet (BLEED_W/H_PX hängen vom Format ab)
+BLEED_CROP_FRAC = _bleed_crop_fractions()
+BLEED_CUT_FRAC = _bleed_cutline_fractions()
+
 # =========================================================
 # Dünnen Außen-Bleed nur für Standard & Gutterfold
 # =========================================================
@@ -314,11 +359,12 @@ def cm_to_pt(cm: float) -> float:
 
 # 1 cm druckfreier Rand rundum
 PRINT_SAFE_MARGIN_CM = 0.1
+PRINT_SAFE_MARGIN_PT = cm_to_pt(PRINT_SAFE_MARGIN_CM)
 MARGINS_PT = {
-    "left":   cm_to_pt(PRINT_SAFE_MARGIN_CM),
-    "right":  cm_to_pt(PRINT_SAFE_MARGIN_CM),
-    "top":    cm_to_pt(PRINT_SAFE_MARGIN_CM),
-    "bottom": cm_to_pt(PRINT_SAFE_MARGIN_CM),
+    "left":   PRINT_SAFE_MARGIN_PT,
+    "right":  PRINT_SAFE_MARGIN_PT,
+    "top":    PRINT_SAFE_MARGIN_PT,
+    "bottom": PRINT_SAFE_MARGIN_PT,
 }
 
 # Untere Reserve: verhindert, dass Karten die Fußzeile überdecken
@@ -341,14 +387,30 @@ BACK_X_OFFSET_PT = 0.0
 BACK_Y_OFFSET_PT = 0.0
 
 def _mm_to_pt(mm: float) -> float:
-    return (mm / 25.4) * 72.0
+    return mm * PT_PER_MM
 
-def draw_logo_in_header_band(c, logo_path, page_w, page_h, margins, header_h):
+def compute_logo_placement(logo_path, page_w, page_h, margins, grid_top_y):
+    """
+    Logo-Position (x, y, w, h) im Kopfband über dem Raster, oder None (kein Logo/kein Platz).
+    Hängt nur von Seite und Raster ab -> einmal pro Layout berechnen, nicht pro Seite.
+    """
+    if not logo_path:
+        return None
     lw, lh = fit_logo_with_constraints(logo_path, LOGO_MAX_W, LOGO_MAX_H)
+    max_header_h = max(0.0, page_h - margins["top"] - grid_top_y - LOGO_GAP_TO_GRID)
+    header_h = min(lh, max_header_h)
+    if header_h <= 1.0:
+        return None
     x = margins["left"] + RESERVE_LEFT_PT + (page_w - margins["left"] - margins["right"]
                                              - RESERVE_LEFT_PT - RESERVE_RIGHT_PT - lw)/2.0
     y = page_h - margins["top"] - header_h + (header_h - lh)/2.0  # mittig im Kopfband
-    c.drawImage(ImageReader(str(logo_path)), x, y, width=lw, height=lh,
+    return x, y, lw, lh
+
+def draw_logo_in_header_band(c, logo_path, placement):
+    if placement is None:
+        return
+    x, y, lw, lh = placement
+    c.drawImage(get_image_reader(logo_path), x, y, width=lw, height=lh,
                 preserveAspectRatio=True, mask="auto")
 
 
@@ -395,6 +457,8 @@ def get_writable_base_dir() -> Path:
         return get_macos_documents_base_dir()
     return get_app_dir()
 
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
 def make_safe_name(name: str) -> str:
     """
     Sanitizes a UI-provided base name for use in a folder:
@@ -402,10 +466,9 @@ def make_safe_name(name: str) -> str:
     - replaces any non [A-Za-z0-9._-] with '_'
     - strips leading/trailing underscores
     """
-    import re as _re
     if not name:
         return "output"
-    s = _re.sub(r"[^A-Za-z0-9._-]+", "_", name.strip())
+    s = _SAFE_NAME_RE.sub("_", name.strip())
     return s.strip("_") or "output"
 
 def build_generation_dir(out_base: str) -> Path:
@@ -419,22 +482,45 @@ def build_generation_dir(out_base: str) -> Path:
     gen_dir.mkdir(parents=True, exist_ok=True)
     return gen_dir
 
+# INI-Pfad einmal pro Lauf auflösen (resolve() = realpath-Syscalls, macOS zusätzlich mkdir);
+# der EXE-/Skriptort ändert sich während eines Laufs nicht.
+_INI_PATH: Optional[Path] = None
+
 def get_ini_path() -> Path:
-    return get_writable_base_dir() / "PnP_PDF_Creator.ini"
+    global _INI_PATH
+    if _INI_PATH is None:
+        _INI_PATH = get_writable_base_dir() / "PnP_PDF_Creator.ini"
+    return _INI_PATH
 
 # =========================================================
 # INI handling (UI language + cutmark settings)
 # =========================================================
 
+# Zuletzt gelesener/geschriebener Parser samt (Pfad, mtime_ns, Größe) der INI:
+# unveränderte Datei -> kein erneutes Öffnen und Parsen (z. B. --lang schreibt, danach lädt der Sprach-Check).
+_CP_CACHE: Dict[str, object] = {}
+
+def _ini_stat_key(ini_path: Path):
+    try:
+        st = ini_path.stat()
+    except OSError:
+        return None
+    return (str(ini_path), st.st_mtime_ns, st.st_size)
+
 def load_config() -> configparser.ConfigParser:
-    cp = configparser.ConfigParser()
     ini_path = get_ini_path()
-    if ini_path.exists():
+    key = _ini_stat_key(ini_path)
+    if key is not None and _CP_CACHE.get('key') == key:
+        return _CP_CACHE['cp']
+    cp = configparser.ConfigParser()
+    if key is not None:
         try:
-            cp.read(ini_path, encoding='utf-8')
+            # Ganze Datei in einem Rutsch lesen statt zeilenweiser Dateiiteration in cp.read()
+            cp.read_string(ini_path.read_bytes().decode('utf-8'), source=str(ini_path))
         except Exception:
             # broken INI -> ignore
             pass
+        _CP_CACHE.update(key=key, cp=cp)
     return cp
 
 
@@ -443,7 +529,10 @@ def write_config(cp: configparser.ConfigParser) -> None:
     try:
         with ini_path.open('w', encoding='utf-8') as f:
             cp.write(f)
+        # Geschriebener Stand == cp -> direkt als Cache für den nächsten load_config() übernehmen
+        _CP_CACHE.update(key=_ini_stat_key(ini_path), cp=cp)
     except Exception as e:
+        _CP_CACHE.clear()
         print(f"[WARN] Could not write INI next to EXE: {ini_path} ({e})")
         print("[WARN] If the EXE is in a protected folder (e.g. Program Files), move it to a writable folder.")
 
@@ -485,76 +574,65 @@ def _get_outer_bleed_keep_px(cp: configparser.ConfigParser,
         return 20
     return v       
 
-def ensure_cutmark_defaults(cp: configparser.ConfigParser) -> bool:
-    # Ensure [cutmarks] section exists with defaults. Returns True if cp was modified.
+def _ini_default_sections() -> Dict[str, Dict[str, str]]:
+    """
+    Alle INI-Defaults als {Sektion: {Option: Wert}} (Reihenfolge = Reihenfolge in der INI).
+    Werte aus Globals werden beim Aufruf gelesen, damit bereits geladene Werte gelten.
+    """
+    return {
+        'cutmarks': {
+            'length_pt_standard': str(CUTMARK_LEN_PT_STD),
+            'width_pt_standard': str(CUTMARK_LINE_PT_STD),
+            'length_pt_bleed': str(CUTMARK_LEN_PT_BLEED),
+            'width_pt_bleed': str(CUTMARK_LINE_PT_BLEED),
+        },
+        # e.g. shared cardback image name, logo name
+        'assets': {
+            'cardback_name': DEFAULT_CARDBACK_BASENAME,
+            'logo_name': DEFAULT_LOGO_BASENAME,
+            'rulebook_name': DEFAULT_RULEBOOK_BASENAME,
+            'rulebook_rotate': DEFAULT_RULEBOOK_ROTATE_MODE,
+        },
+        # Default = Poker-Trim 750x1050 px, damit sofort nutzbar
+        'custom_format': {
+            'name': 'Custom (INI)',
+            'inner_w_px': '750',
+            'inner_h_px': '1050',
+        },
+        'standard_and_gutterfold': {
+            'outer_bleed_keep_px': str(OUTER_BLEED_KEEP_PX),
+        },
+        # x_offset/y_offset in mm
+        'backside_offset': {
+            'x_offset': '0',
+            'y_offset': '0',
+        },
+    }
+
+def _ensure_section_defaults(cp: configparser.ConfigParser, section: str, defaults: Dict[str, str]) -> bool:
+    # Fehlende Sektion/Optionen ergänzen; vorhandene Werte bleiben. True, wenn cp geändert wurde.
     changed = False
-    if not cp.has_section('cutmarks'):
-        cp.add_section('cutmarks')
+    if not cp.has_section(section):
+        cp.add_section(section)
         changed = True
-    defaults = {
-        'length_pt_standard': str(CUTMARK_LEN_PT_STD),
-        'width_pt_standard': str(CUTMARK_LINE_PT_STD),
-        'length_pt_bleed': str(CUTMARK_LEN_PT_BLEED),
-        'width_pt_bleed': str(CUTMARK_LINE_PT_BLEED),
-    }
+    sec = cp[section]
     for k, v in defaults.items():
-        if not cp.has_option('cutmarks', k):
-            cp.set('cutmarks', k, v)
+        if k not in sec:
+            sec[k] = v
             changed = True
     return changed
 
-def ensure_standard_and_gutterfold_defaults(cp: configparser.ConfigParser) -> bool:
-    """
-    Stellt sicher, dass die Sektion [standard_and_gutterfold]
-    existiert und den Parameter outer_bleed_keep_px enthält.
-    """
+def ensure_all_defaults(cp: configparser.ConfigParser) -> bool:
+    """Ergänzt alle INI-Defaults in einem Durchlauf. Rückgabe: True, wenn cp geändert wurde."""
     changed = False
-
-    if not cp.has_section("standard_and_gutterfold"):
-        cp.add_section("standard_and_gutterfold")
-        changed = True
-
-    if not cp.has_option("standard_and_gutterfold", "outer_bleed_keep_px"):
-        cp.set("standard_and_gutterfold", "outer_bleed_keep_px", str(OUTER_BLEED_KEEP_PX))
-        changed = True
-
+    for section, defaults in _ini_default_sections().items():
+        changed = _ensure_section_defaults(cp, section, defaults) or changed
     return changed
 
-def ensure_custom_format_defaults(cp: configparser.ConfigParser) -> bool:
-    """
-    Stellt [custom_format] mit sinnvollen Defaults bereit.
-    Rückgabe: True, wenn cp geändert wurde.
-    """
-    changed = False
-    if not cp.has_section('custom_format'):
-        cp.add_section('custom_format')
-        changed = True
-    if not cp.has_option('custom_format', 'name'):
-        cp.set('custom_format', 'name', 'Custom (INI)')
-        changed = True
-    # Default = Poker-Trim 750x1050 px, damit sofort nutzbar
-    if not cp.has_option('custom_format', 'inner_w_px'):
-        cp.set('custom_format', 'inner_w_px', '750')
-        changed = True
-    if not cp.has_option('custom_format', 'inner_h_px'):
-        cp.set('custom_format', 'inner_h_px', '1050')
-        changed = True
-    return changed
+def ensure_cutmark_defaults(cp: configparser.ConfigParser) -> bool:
+    # Ensure [cutmarks] section exists with defaults. Returns True if cp was modified.
+    return _ensure_section_defaults(cp, 'cutmarks', _ini_default_sections()['cutmarks'])
 
-def ensure_backside_offset_defaults(cp: configparser.ConfigParser) -> bool:
-    """Sichert [backside_offset] + Defaults (x_offset/y_offset in mm)."""
-    changed = False
-    if not cp.has_section('backside_offset'):
-        cp.add_section('backside_offset')
-        changed = True
-    if not cp.has_option('backside_offset', 'x_offset'):
-        cp.set('backside_offset', 'x_offset', '0')
-        changed = True
-    if not cp.has_option('backside_offset', 'y_offset'):
-        cp.set('backside_offset', 'y_offset', '0')
-        changed = True
-    return changed
- 
 def load_backside_offset_from_config(cp: configparser.ConfigParser) -> None:
     """Liest mm-Werte aus [backside_offset] und pflegt globale *_PT."""
     global BACK_X_OFFSET_PT, BACK_Y_OFFSET_PT
@@ -574,6 +652,8 @@ def load_custom_format_from_config(cp: configparser.ConfigParser) -> Optional[di
     Liest [custom_format] und baut ein Format-Dict im Stil von CARD_FORMATS.
     Erwartet 'name', 'inner_w_px', 'inner_h_px' > 0.
     """
+    if not cp.has_section('custom_format'):
+        return None
     try:
         name = cp.get('custom_format', 'name', fallback='').strip()
         w_px = cp.getint('custom_format', 'inner_w_px', fallback=0)
@@ -581,8 +661,8 @@ def load_custom_format_from_config(cp: configparser.ConfigParser) -> Optional[di
         if not name or w_px <= 0 or h_px <= 0:
             return None
         # mm aus px bei TEMPLATE_DPI
-        w_mm = _px_to_mm(float(w_px))
-        h_mm = _px_to_mm(float(h_px))
+        w_mm = _px_to_mm(w_px)
+        h_mm = _px_to_mm(h_px)
         # ID 6 reservieren
         return {'id': 6, 'name': name, 'w_mm': w_mm, 'h_mm': h_mm, 'src': 'ini'}
     except Exception:
@@ -590,23 +670,7 @@ def load_custom_format_from_config(cp: configparser.ConfigParser) -> Optional[di
 
 def ensure_assets_defaults(cp: configparser.ConfigParser) -> bool:
     # Ensure [assets] section exists with defaults (e.g. shared cardback image name, logo name).
-    changed = False
-    if not cp.has_section('assets'):
-        cp.add_section('assets')
-        changed = True
-    if not cp.has_option('assets', 'cardback_name'):
-        cp.set('assets', 'cardback_name', DEFAULT_CARDBACK_BASENAME)
-        changed = True
-    if not cp.has_option('assets', 'logo_name'):
-        cp.set('assets', 'logo_name', DEFAULT_LOGO_BASENAME)
-        changed = True
-    if not cp.has_option('assets', 'rulebook_name'):
-        cp.set('assets', 'rulebook_name', DEFAULT_RULEBOOK_BASENAME)
-        changed = True
-    if not cp.has_option('assets', 'rulebook_rotate'):
-        cp.set('assets', 'rulebook_rotate', DEFAULT_RULEBOOK_ROTATE_MODE)
-        changed = True
-    return changed
+    return _ensure_section_defaults(cp, 'assets', _ini_default_sections()['assets'])
 
 def load_assets_from_config(cp: configparser.ConfigParser) -> None:
     # Load asset settings from INI into global variables.
@@ -637,26 +701,28 @@ def load_cutmarks_from_config(cp: configparser.ConfigParser) -> None:
 
 def save_lang_to_ini(lang: str) -> None:
     cp = load_config()
+    changed = False
     if not cp.has_section('ui'):
         cp.add_section('ui')
-    cp.set('ui', 'lang', lang)
+    if cp.get('ui', 'lang', fallback=None) != lang:
+        cp.set('ui', 'lang', lang)
+        changed = True
     # Ensure cutmark defaults exist so users can edit them
-    ensure_cutmark_defaults(cp)
+    changed = ensure_cutmark_defaults(cp) or changed
     # Ensure assets defaults exist so users can edit them
-    ensure_assets_defaults(cp)    
+    changed = ensure_assets_defaults(cp) or changed
     # --- SAFETY: Stelle sicher, dass cutmark_color wirklich gesetzt ist ---
     if not cp.has_option('cutmarks', 'cutmark_color'):
         cp.set('cutmarks', 'cutmark_color', '#000000')
-    write_config(cp)
+        changed = True
+    # Wiederholtes --lang mit gleicher Sprache: Datei unverändert lassen (kein Schreiben)
+    if changed:
+        write_config(cp)
 
 def prompt_language_if_needed():
     global LANG
     cp = load_config()
-    changed = ensure_cutmark_defaults(cp)
-    changed = ensure_assets_defaults(cp) or changed
-    changed = ensure_custom_format_defaults(cp) or changed
-    changed = ensure_standard_and_gutterfold_defaults(cp) or changed
-    changed = ensure_backside_offset_defaults(cp) or changed
+    changed = ensure_all_defaults(cp)
     
     # Optional: gleich laden & an CARD_FORMATS anhängen (am Ende der Liste)
     fmt6 = load_custom_format_from_config(cp)
@@ -1033,6 +1099,49 @@ I18N = {
 # =========================================================
 PDF_CONFIG_NAME_DEFAULT = "pdfConfig.txt"
 
+# Vorlage für pdfConfig.txt (EN only); Feldreihenfolge entspricht exakt der UI-Reihenfolge
+_PDF_CONFIG_TEMPLATE = """\
+# ------------------------------------------------------------
+# pdfConfig.txt — Template (EN only)
+# Copy this file into a card-image folder and adjust the values.
+# If present, the UI prompts are skipped and values from this file
+# are used for PDF generation.
+# ------------------------------------------------------------
+
+# 1) CARD_FORMAT (numeric id):
+#    1=Poker, 2=Euro, 3=Mini Euro, 4=American, 5=Mini American, 6=Custom (from INI).
+#    Use the numeric id listed above. If invalid/empty, 1 (Poker) is used.
+CARD_FORMAT=1
+
+# 2) LAYOUT:
+#    Allowed values (case-insensitive): Standard | Bleed | Gutterfold | All
+#    All = generates all supported layouts your images qualify for.
+LAYOUT=All
+
+# 3) PAPER:
+#    Allowed values (case-insensitive): Both | A4 | Letter
+#    Both = generate A4 and Letter variants.
+PAPER=Both
+
+# 4) QUALITY:
+#    Allowed values (case-insensitive): Lossless | High | Medium | Low
+#    Recommended default is High.
+QUALITY=High
+
+# 5) BOTTOM_TEXT:
+#    Optional free text printed centered in the footer (max 150 chars).
+#    The sequence (C) is automatically converted to ©.
+BOTTOM_TEXT=
+
+# 6) VERSION:
+#    Optional version string printed bottom-left (e.g., v1.0 or date).
+VERSION=
+
+# 7) OUTPUT_NAME:
+#    Output base filename without .pdf (invalid characters are sanitized).
+OUTPUT_NAME=cards
+"""
+
 def write_pdf_config_template(dst: Path) -> None:
     """
     Write an English-only template for pdfConfig.txt.
@@ -1041,50 +1150,8 @@ def write_pdf_config_template(dst: Path) -> None:
     """
     if dst.exists():
         return
-    lines = [
-        "# ------------------------------------------------------------",
-        "# pdfConfig.txt — Template (EN only)",
-        "# Copy this file into a card-image folder and adjust the values.",
-        "# If present, the UI prompts are skipped and values from this file",
-        "# are used for PDF generation.",
-        "# ------------------------------------------------------------",
-        "",
-        "# 1) CARD_FORMAT (numeric id):",
-        "#    1=Poker, 2=Euro, 3=Mini Euro, 4=American, 5=Mini American, 6=Custom (from INI).",
-        "#    Use the numeric id listed above. If invalid/empty, 1 (Poker) is used.",
-        "CARD_FORMAT=1",
-        "",
-        "# 2) LAYOUT:",
-        "#    Allowed values (case-insensitive): Standard | Bleed | Gutterfold | All",
-        "#    All = generates all supported layouts your images qualify for.",
-        "LAYOUT=All",
-        "",
-        "# 3) PAPER:",
-        "#    Allowed values (case-insensitive): Both | A4 | Letter",
-        "#    Both = generate A4 and Letter variants.",
-        "PAPER=Both",
-        "",
-        "# 4) QUALITY:",
-        "#    Allowed values (case-insensitive): Lossless | High | Medium | Low",
-        "#    Recommended default is High.",
-        "QUALITY=High",
-        "",
-        "# 5) BOTTOM_TEXT:",
-        "#    Optional free text printed centered in the footer (max 150 chars).",
-        "#    The sequence (C) is automatically converted to ©.",
-        "BOTTOM_TEXT=",
-        "",
-        "# 6) VERSION:",
-        "#    Optional version string printed bottom-left (e.g., v1.0 or date).",
-        "VERSION=",
-        "",
-        "# 7) OUTPUT_NAME:",
-        "#    Output base filename without .pdf (invalid characters are sanitized).",
-        "OUTPUT_NAME=cards",
-        "",
-    ]
     try:
-        dst.write_text("\n".join(lines), encoding="utf-8")
+        dst.write_text(_PDF_CONFIG_TEMPLATE, encoding="utf-8")
     except Exception:
         pass
 
@@ -1135,7 +1202,7 @@ def _fmt_by_id(fmt_id: int) -> dict:
 
 def read_card_format_override_only(cfg_path: Path, default_id: int) -> int:
     """Read only CARD_FORMAT from a pdfConfig.txt; ignore all other keys."""
-    if not (cfg_path and cfg_path.exists() and cfg_path.is_file()):
+    if not (cfg_path and cfg_path.is_file()):
         return int(default_id)
     cfg = read_pdf_config(cfg_path)
     if not cfg:
@@ -1176,19 +1243,46 @@ def _map_paper_value(v: str):
     # default "both"
     return [(A4, "_A4"), (letter, "_Letter")]
 
+# Je Sprache eine flache Tabelle mit Deutsch als Basis (fehlende Übersetzungen fallen so ohne
+# zweiten Lookup auf Deutsch zurück); nach LANG geschlüsselt, da Worker LANG erst später setzen.
+_T_TABLES: Dict[str, Dict[str, str]] = {}
+
 def t(key: str, **kwargs) -> str:
-    lang = I18N.get(LANG, I18N["de"])
-    msg = lang.get(key, I18N["de"].get(key, key))
-    return msg.format(**kwargs)
+    table = _T_TABLES.get(LANG)
+    if table is None:
+        table = _T_TABLES[LANG] = {**I18N["de"], **I18N.get(LANG, {})}
+    msg = table.get(key, key)
+    # Ohne Platzhalter-Werte kein format(): keine Meldung enthält {{/}}-Escapes
+    return msg.format(**kwargs) if kwargs else msg
+
+
+# =========================================================
+# Optionale UI-Abhängigkeiten (lazy)
+# =========================================================
+# questionary (optionale Komfort-Listenprompts) erst beim ersten Prompt laden:
+# zieht prompt_toolkit nach (~130 ms), was sonst jeder Worker-Prozess beim Import zahlt.
+_QUESTIONARY = False  # False = noch nicht versucht, None = nicht verfügbar
+
+def _get_questionary():
+    global _QUESTIONARY
+    if _QUESTIONARY is False:
+        try:
+            import questionary as _q
+        except Exception:
+            _q = None
+        _QUESTIONARY = _q
+    return _QUESTIONARY
+
 
 # =========================================================
 # Rich-safe helpers (escape markup so literal [...] stays visible)
 # =========================================================
 def _rich_escape(text: str) -> str:
     """Escape Rich markup so strings containing [...] render literally in Panels."""
+    if _rich_markup_escape is None:
+        return text
     try:
-        from rich.markup import escape
-        return escape(text)
+        return _rich_markup_escape(text)
     except Exception:
         return text
 
@@ -1202,12 +1296,13 @@ def _show_panel(message: str, title: str = "", border_style: str = "red") -> Non
     except Exception:
         print(message)
 
+_DIGITS_SPLIT_RE = re.compile(r'(\d+)')
+
 def _alnum_key(name: str):
     """
     Alphanumerischer Sort-Key: 'Folder2' kommt vor 'Folder10'.
     """
-    import re as _re
-    parts = _re.split(r'(\d+)', (name or '').lower())
+    parts = _DIGITS_SPLIT_RE.split((name or '').lower())
     return [int(p) if p.isdigit() else p for p in parts]
 
 def iter_folders_dfs(root: Path):
@@ -1218,7 +1313,8 @@ def iter_folders_dfs(root: Path):
     """
     yield root
     try:
-        subdirs = [p for p in root.iterdir() if p.is_dir()]
+        with os.scandir(root) as it:
+            subdirs = [Path(e.path) for e in it if e.is_dir()]
     except Exception:
         subdirs = []
     subdirs.sort(key=lambda p: _alnum_key(p.name))
@@ -1236,10 +1332,11 @@ def _sample_images_in_tree(root: Path, limit: int = 5):
         imgs = []
         for folder in iter_folders_dfs(root):
             try:
-                for p in folder.iterdir():
-                    if p.is_file() and p.suffix.lower() in SUPPORTED_EXT:
-                        rel = str(p.relative_to(root))
-                        imgs.append(rel)
+                with os.scandir(folder) as it:
+                    for e in it:
+                        if os.path.splitext(e.name)[1].lower() in SUPPORTED_EXT and e.is_file():
+                            rel = str(Path(e.path).relative_to(root))
+                            imgs.append(rel)
             except Exception:
                 continue
         # Deterministic ordering for display (alphanumerical over the relative path)
@@ -1280,7 +1377,9 @@ def pause_before_exit(message: str = "", print_message: bool = True) -> None:
 # =========================================================
 def create_pdf_canvas(out_path: Path, pagesize_tuple, author: str = ''):
     """Create ReportLab canvas and set PDF metadata."""
-    c = canvas.Canvas(str(out_path), pagesize=pagesize_tuple)
+    # Pfad statt eigenem Dateiobjekt: ReportLab baut das PDF bei save() komplett im Speicher
+    # und schreibt es mit einem einzigen write() -> ein großer Schreibpuffer brächte nichts.
+    c = canvas.Canvas(str(out_path), pagesize=pagesize_tuple, pageCompression=1)
     # PDF document property: Creator
     c.setCreator('Created by PnP PDF Creator')
     # PDF document property: Author (empty string if not provided)
@@ -1295,36 +1394,323 @@ def create_pdf_canvas(out_path: Path, pagesize_tuple, author: str = ''):
     return c
 
 # =========================================================
-# Card image preprocessing cache (lossy modes only)
+# Card image preprocessing cache (persistent across runs unless --no-cache)
 # =========================================================
 TMP_DIR = Path(tempfile.gettempdir()) / "card_pdf_cache"
 TMP_DIR.mkdir(parents=True, exist_ok=True)
 
-# Always clear preprocessing cache on each run (prevents stale resized images)
+# --no-cache: Cache bei jedem Lauf komplett leeren (altes Verhalten)
 def clear_tmp_cache():
     try:
-        for p in TMP_DIR.iterdir():
-            if p.is_file():
-                p.unlink(missing_ok=True)
+        with os.scandir(TMP_DIR) as it:
+            for entry in it:
+                if entry.is_file():
+                    os.unlink(entry.path)
     except Exception:
         # If cache cannot be cleared, continue gracefully
         pass
+    # In-memory lookups refer to the files just deleted
+    _IMG_SIZE_CACHE.clear()
+    _FIT_CACHE.clear()
+    _IMG_READER_CACHE.clear()
+    _MEM_JPEG.clear()
+    _PREPROCESS_MEMO.clear()
+    _EXISTS_CACHE.clear()
+
+def prune_tmp_cache(max_age_days: float = PREPROCESS_CACHE_MAX_AGE_DAYS) -> None:
+    """
+    Persistenter Cache: nur Dateien entfernen, die seit max_age_days weder gelesen noch geschrieben
+    wurden. Veraltete Einträge (Quelle geändert, andere Version) werden ohnehin nicht mehr
+    referenziert, weil Größe/mtime der Quelle, SCRIPT_VERSION und die Ausgabe-Parameter
+    (_preprocess_output_sig) im Dateinamen stecken.
+    """
+    cutoff = time.time() - max_age_days * 86400.0
+    try:
+        with os.scandir(TMP_DIR) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        if max(st.st_atime, st.st_mtime) < cutoff:
+                            os.unlink(entry.path)
+                except OSError:
+                    continue
+    except Exception:
+        pass
+
+def prepare_tmp_cache(keep: bool) -> None:
+    # Beim Start: Cache behalten (nur alte Dateien aufräumen) oder wie früher komplett leeren
+    global KEEP_PREPROCESS_CACHE
+    KEEP_PREPROCESS_CACHE = keep
+    if keep:
+        prune_tmp_cache()
+    else:
+        clear_tmp_cache()
 
 _CONVERT_CACHE: Dict[Tuple[str, str, str, str], Path] = {}
+# Vorgeschaltet: Ergebnis je (unaufgelöstem) Pfad + Parametern, ohne resolve()/exists() pro Aufruf
+_PREPROCESS_MEMO: Dict[tuple, Path] = {}
+# Pixelgrößen und Einpass-Maße je Bildpfad (gleiche Karte wird pro Seite/Layout mehrfach platziert);
+# die Vorverarbeitung trägt die Größe ihrer Ausgabe direkt ein -> fit_image_into_box öffnet nichts mehr
+_IMG_SIZE_CACHE: Dict[str, Optional[Tuple[int, int]]] = {}
+_FIT_CACHE: Dict[Tuple[str, float, float, int], Tuple[float, float]] = {}
+# Ein ImageReader je JPEG-Datei: ReportLab liest die Bytes dann nur einmal (Digest statt Decode,
+# siehe _JpegImageReader). Nur JPEG-Reader werden gemerkt – ein Reader für PNG & Co. hält nach dem
+# ersten drawImage() die kompletten Rohpixel (~5-6 MB je Karte) bis Ende des PDFs fest.
+# Bewusst drawImage statt drawInlineImage, auch bei kleinen Karten/Qualität "low": Inline-Bilder
+# werden pro Aufruf neu (Flate/ASCII85) kodiert und nie dedupliziert, JPEGs nicht durchgereicht.
+_IMG_READER_CACHE: Dict[str, ImageReader] = {}
+# Mit --no-cache bleibt verlustbehaftete Vorverarbeitung als JPEG-Bytes im Speicher (Schlüssel = virtueller
+# TMP_DIR-Pfad) -> spart pro Karte einen Schreib- und einen Lesezugriff. Mit persistentem Cache (Default)
+# landet sie in TMP_DIR, damit der nächste Lauf sie wiederverwenden kann.
+_MEM_JPEG: Dict[str, bytes] = {}
+
+class _JpegImageReader(ImageReader):
+    """
+    JPEGs bettet ReportLab unverändert ein (jpeg_fh). drawImage() ruft getRGBData() trotzdem auf,
+    nur um den XObject-Namen zu bilden, und dekodiert dafür das komplette Bild (und hält die
+    Rohdaten im Speicher). Für JPEG genügt ein Digest der Dateibytes; alles andere wie gehabt.
+    Nutzt die privaten Felder _data/_dataA und dass ImageReader die Datei in ein BytesIO liest
+    (getestet mit reportlab 5.0.x, siehe requirements.txt); ohne getvalue() -> Standardweg.
+    """
+    def getRGBData(self):
+        if self.jpeg_fh() is None or not hasattr(self.fp, "getvalue"):
+            return super().getRGBData()
+        if self._data is None:
+            self._dataA = None
+            self._data = hashlib.md5(self.fp.getvalue()).digest()
+        return self._data
 
-def get_image_px_size(img_path: Path) -> Optional[Tuple[int, int]]:
-    if Image is None:
-        return None
+_JPEG_SUFFIXES = (".jpg", ".jpeg")
+
+def get_image_reader(img_path: Path):
+    """
+    Bildquelle für c.drawImage(): JPEGs als gemerkter _JpegImageReader, alles andere als
+    Dateiname. Beim Dateinamen bildet ReportLab den XObject-Namen aus dem Pfad (gleiche Datei =
+    ein XObject pro PDF) und dekodiert nur beim ersten Einbetten – es bleibt kein Pixelpuffer hängen.
+    """
+    key = str(img_path)
+    reader = _IMG_READER_CACHE.get(key)
+    if reader is not None:
+        return reader
+    data = _MEM_JPEG.get(key)
+    if data is None and os.path.splitext(key)[1].lower() not in _JPEG_SUFFIXES:
+        return key
+    reader = _JpegImageReader(io.BytesIO(data) if data is not None else key)
+    if reader.jpeg_fh() is None:
+        # Endung .jpg, aber kein JPEG: nicht merken (hielte sonst ebenfalls Rohpixel fest)
+        return reader
+    _IMG_READER_CACHE[key] = reader
+    return reader
+
+# optimize=True bleibt: die optimierten Huffman-Tabellen kosten bei Foto-Karten ~7 ms mehr pro
+# Karte (750x1050, q90: 5,8 -> 13 ms) und sparen dort ~7 %, bei flächigen/Line-Art-Karten aber
+# 40-50 % (143 -> 79 KB, Standard-PDF eines Decks 671 -> 357 KB) – die Dateien landen im PDF.
+# Kein progressive (bringt im PDF nichts); 4:2:0-Chroma entspricht Pillows Default, hier nur explizit.
+_JPEG_SAVE_OPTS = {"optimize": True, "progressive": False, "subsampling": 2}
+
+def _save_atomic(im, out_file: Path, fmt: str, **opts) -> None:
+    # TMP_DIR teilen sich parallele PDF-Worker (A4/Letter bereiten dieselbe Karte ggf. gleichzeitig
+    # vor): erst unter eigenem Namen schreiben, dann per os.replace() einsetzen -> kein Leser sieht
+    # je eine halb geschriebene Datei, und eine vorhandene Datei wird ersetzt statt überschrieben.
+    tmp = out_file.with_name(f"{out_file.name}.{os.getpid()}.tmp")
     try:
-        with Image.open(img_path) as im:
-            return im.size
+        im.save(tmp, fmt, **opts)
+        os.replace(tmp, out_file)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def _save_preprocessed_jpeg(im, out_file: Path, jpeg_q: int) -> None:
+    if KEEP_PREPROCESS_CACHE:
+        _save_atomic(im, out_file, "JPEG", quality=jpeg_q, **_JPEG_SAVE_OPTS)
+        _IMG_SIZE_CACHE[str(out_file)] = im.size
+        return
+    buf = io.BytesIO()
+    im.save(buf, "JPEG", quality=jpeg_q, **_JPEG_SAVE_OPTS)
+    key = str(out_file)
+    _MEM_JPEG[key] = buf.getvalue()
+    _IMG_SIZE_CACHE[key] = im.size
+
+# exists() je Bildpfad nur einmal pro Lauf: dieselbe Karte wird für Belegung, Vorder- und
+# Rückseite, Gutterfold und mehrere Layouts geprüft (teuer auf OneDrive/Dropbox/Netzlaufwerken)
+_EXISTS_CACHE: Dict[str, bool] = {}
+
+def image_exists(p) -> bool:
+    if not p:
+        return False
+    key = str(p)
+    hit = _EXISTS_CACHE.get(key)
+    if hit is None:
+        hit = _EXISTS_CACHE[key] = os.path.exists(key)
+    return hit
+
+def _preprocessed_available(p: Path) -> bool:
+    return str(p) in _MEM_JPEG or p.exists()
+
+# JPEG-SOFn-Marker (Start of Frame) tragen Höhe/Breite; C4/C8/CC sind keine SOF-Marker.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def fast_image_size(img_path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) straight from the PNG IHDR / JPEG SOFn header bytes.
+    No decoder state is set up; returns None for unknown/broken files so the
+    caller can fall back to PIL.
+    """
+    try:
+        with open(img_path, "rb") as f:
+            head = f.read(24)
+            if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+                w, h = struct.unpack(">II", head[16:24])
+                return int(w), int(h)
+            if head[:2] != b"\xff\xd8":
+                return None
+            # JPEG: Segmente ab Offset 2 durchlaufen, bis ein SOFn-Marker kommt
+            f.seek(2)
+            while True:
+                b = f.read(1)
+                while b and b != b"\xff":
+                    b = f.read(1)
+                while b == b"\xff":
+                    b = f.read(1)
+                if not b:
+                    return None
+                marker = b[0]
+                if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                    continue  # Marker ohne Längenfeld
+                seg = f.read(2)
+                if len(seg) != 2:
+                    return None
+                seg_len = struct.unpack(">H", seg)[0]
+                if marker in _JPEG_SOF_MARKERS:
+                    sof = f.read(5)
+                    if len(sof) != 5:
+                        return None
+                    h, w = struct.unpack(">HH", sof[1:5])
+                    return int(w), int(h)
+                f.seek(seg_len - 2, 1)
     except Exception:
         return None
 
+def get_image_px_size(img_path: Path) -> Optional[Tuple[int, int]]:
+    key = str(img_path)
+    if key in _IMG_SIZE_CACHE:
+        return _IMG_SIZE_CACHE[key]
+    size = fast_image_size(img_path)
+    if not size and Image is not None:
+        try:
+            with Image.open(img_path) as im:
+                size = im.size
+        except Exception:
+            size = None
+    _IMG_SIZE_CACHE[key] = size
+    return size
+
 def target_pixels_for_box_inches(w_in: float, h_in: float, dpi: int) -> Tuple[int, int]:
     return int(round(w_in * dpi)), int(round(h_in * dpi))
 
+# Ein Hash je Quelldatei (aufgelöster Pfad + Größe + mtime + Skriptversion + Ausgabe-Parameter);
+# Qualität/Box/Crop stehen lesbar im Dateinamen. Da der Cache über Läufe hinweg bleibt, macht jede
+# Änderung der Quelle (oder der Vorverarbeitung) alte Einträge einfach unerreichbar, statt sie zu überschreiben.
+_FILE_HASH_CACHE: Dict[Tuple[str, int, int, str], str] = {}
+# Aufgelöster Pfad je Quellbild: resolve() = realpath-Syscalls (Windows besonders teuer); dieselbe
+# Karte wird mit mehreren Qualitäts-/Layout-Parametern vorbereitet, die Ordner ändern sich im Lauf nicht
+_RESOLVED_CACHE: Dict[str, str] = {}
+
+def _resolved_str(p: Path) -> str:
+    key = str(p)
+    rp = _RESOLVED_CACHE.get(key)
+    if rp is None:
+        rp = _RESOLVED_CACHE[key] = str(Path(p).resolve())
+    return rp
+
+def _preprocess_output_sig() -> str:
+    # Alles außer der Quelle selbst, was Pixel/Bytes einer vorbereiteten Datei bestimmt und nicht
+    # schon lesbar im Dateinamen steht. Bleed-/Innenmaße hängen am aktiven Kartenformat.
+    return repr((
+        _CACHE_FORMAT, sorted(_JPEG_SAVE_OPTS.items()),
+        sorted((k, v["dpi"], v["jpeg_quality"]) for k, v in QUALITY_PRESETS.items()),
+        _RESAMPLE_DOWN, _RESAMPLE_UP, TEMPLATE_DPI,
+        BLEED_W_PX, BLEED_H_PX, BLEED_LEFT_TOP_PX, BLEED_RIGHT_BOTTOM_PX, BLEED_CROP_FRAC, OUTER_BLEED_KEEP_PX,
+    ))
+
+def _source_file_hash(resolved: str) -> str:
+    try:
+        st = os.stat(resolved)
+        size, mtime_ns = st.st_size, st.st_mtime_ns
+    except OSError:
+        size = mtime_ns = 0
+    sig = _preprocess_output_sig()
+    key = (resolved, size, mtime_ns, sig)
+    h = _FILE_HASH_CACHE.get(key)
+    if h is None:
+        h = _FILE_HASH_CACHE[key] = hashlib.md5(
+            f"{SCRIPT_VERSION}\n{sig}\n{resolved}\n{size}\n{mtime_ns}".encode("utf-8")).hexdigest()
+    return h
+
+# Resampling-Filter der Vorverarbeitung (gehen über _preprocess_output_sig in den Cache-Schlüssel)
+_RESAMPLE_DOWN = Image.LANCZOS if Image is not None else None
+_RESAMPLE_UP = Image.BILINEAR if Image is not None else None
+
+def _upscale_filter(src_w: int, src_h: int):
+    # Reines Hochskalieren auf INNER: BILINEAR (Quelle hat ohnehin keine feinen Details, LANCZOS
+    # bringt nur Ringing und kostet Zeit). Wird eine Achse verkleinert, bleibt LANCZOS gegen Aliasing.
+    if src_w <= INNER_W_PX and src_h <= INNER_H_PX:
+        return _RESAMPLE_UP
+    return _RESAMPLE_DOWN
+
+def _draft_jpeg_for_box(im, box: Tuple[int, int, int, int], target_w: int, target_h: int) -> Tuple[int, int, int, int]:
+    """
+    JPEG-Quelle, verlustbehaftete Ausgabe: libjpeg gleich verkleinert dekodieren lassen (1/2, 1/4, 1/8),
+    solange der Ausschnitt danach noch mindestens 2x target_w x target_h hat – die letzte Verkleinerung
+    macht so immer LANCZOS (schärfer als die DCT-Skalierung). Liefert den Ausschnitt in Koordinaten
+    des verkleinerten Bildes (unverändert, wenn nichts gespart wird).
+    """
+    left, top, right, bottom = box
+    scale = 1
+    while scale < 8 and (right - left) // (scale * 4) >= target_w and (bottom - top) // (scale * 4) >= target_h:
+        scale *= 2
+    if scale == 1 or im.format != "JPEG":
+        return box
+    full_w, full_h = im.size
+    if not im.draft(None, (full_w // scale, full_h // scale)) or im.size == (full_w, full_h):
+        return box
+    sx, sy = im.width / full_w, im.height / full_h
+    # Ausschnittsgröße erhalten (gleiches Seitenverhältnis wie ohne draft), nur die Lage runden
+    w, h = int(round((right - left) * sx)), int(round((bottom - top) * sy))
+    left, top = min(int(round(left * sx)), im.width - w), min(int(round(top * sy)), im.height - h)
+    return left, top, left + w, top + h
+
+def _flatten_to_rgb(im):
+    # transparency -> white background
+    if im.mode in ("RGBA", "LA") or ("transparency" in im.info):
+        base = Image.new("RGB", im.size, (255, 255, 255))
+        im_rgba = im.convert("RGBA")
+        base.paste(im_rgba, mask=im_rgba.split()[-1])
+        return base
+    return im.convert("RGB")
+
+def _dbg(fmt: str, *args) -> None:
+    # Diagnose nur bei DEBUG_PREPROCESS; %-Formatierung erst dann (sonst kein String-Aufbau je Bild)
+    if DEBUG_PREPROCESS:
+        print(fmt % args)
+
+def _preprocess_memo_key(img_path: Path, quality_key: str, box_inches: Tuple[float, float], crop_bleed: bool) -> tuple:
+    return ("pdf", str(img_path), quality_key, tuple(box_inches), crop_bleed)
+
 def preprocess_card_image_for_pdf(img_path: Path, quality_key: str, box_inches: Tuple[float, float], crop_bleed: bool = True) -> Path:
+    # Dieselbe Karte kommt auf Vorder-/Rückseite und in mehreren Layouts vor, ein gemeinsamer
+    # Kartenrücken auf jeder Seite -> Ergebnis je Aufrufparameter merken (spart resolve() & Co.)
+    key = _preprocess_memo_key(img_path, quality_key, box_inches, crop_bleed)
+    out = _PREPROCESS_MEMO.get(key)
+    if out is None:
+        out = _PREPROCESS_MEMO[key] = _preprocess_card_image_for_pdf(img_path, quality_key, box_inches, crop_bleed)
+    return out
+
+def _preprocess_card_image_for_pdf(img_path: Path, quality_key: str, box_inches: Tuple[float, float], crop_bleed: bool = True) -> Path:
     """ 
     Preprocess a card image for embedding into PDF.
 
@@ -1340,9 +1726,11 @@ def preprocess_card_image_for_pdf(img_path: Path, quality_key: str, box_inches:
     jpeg_q = preset["jpeg_quality"]
     w_in, h_in = box_inches
 
-    cache_key = (str(img_path.resolve()), quality_key, f"{w_in}x{h_in}", 'crop' if crop_bleed else 'nocrop')
+    resolved = _resolved_str(img_path)
+    crop_tag = 'crop' if crop_bleed else 'nocrop'
+    cache_key = (resolved, quality_key, f"{w_in}x{h_in}", crop_tag)
     cached = _CONVERT_CACHE.get(cache_key)
-    if cached and cached.exists():
+    if cached and _preprocessed_available(cached):
         return cached
 
     # If PIL isn't available, just pass through (no cropping/resizing possible).
@@ -1350,108 +1738,127 @@ def preprocess_card_image_for_pdf(img_path: Path, quality_key: str, box_inches:
         _CONVERT_CACHE[cache_key] = img_path
         return img_path
 
-    h = hashlib.md5((str(img_path.resolve()) + "\n" + quality_key + f"\n{w_in}x{h_in}").encode("utf-8")).hexdigest()
     ext = ".png" if quality_key == "lossless" else ".jpg"
-    out_file = TMP_DIR / f"{img_path.stem}_{quality_key}_{h}{ext}"
-    if out_file.exists():
+    out_file = TMP_DIR / f"{img_path.stem}_{_source_file_hash(resolved)}_{quality_key}_{w_in}x{h_in}_{crop_tag}{ext}"
+    if _preprocessed_available(out_file):
         _CONVERT_CACHE[cache_key] = out_file
         return out_file
 
-    def _center_crop_exact(im_, tw: int, th: int):
-        """Center-crop to exact (tw x th). Requires im_ to be at least that large."""
-        if im_.width == tw and im_.height == th:
-            return im_
-        left = (im_.width - tw) // 2
-        top = (im_.height - th) // 2
-        return im_.crop((left, top, left + tw, top + th))
-
-    def _dbg(msg: str):
-        if DEBUG_PREPROCESS:
-            print(msg)
+    # Fast-Path: Quelle ist bereits exakt im Zielformat (lossless, RGB, Zielgröße)
+    # -> nur Header lesen und die Quelle selbst einbetten (kein Decode/Encode). Ein passendes JPEG
+    # reicht ReportLab unverändert durch, ein daraus erzeugtes PNG wäre nur größer.
+    # Bewusst weder Hardlink noch Kopie im TMP_DIR: ein Hardlink teilte sich den Inode mit der
+    # Nutzerdatei, jeder spätere Schreibzugriff auf den Cache-Eintrag träfe das Original.
+    if quality_key == "lossless" and img_path.suffix.lower() in (".png", ".jpg", ".jpeg"):
+        target_px = (INNER_W_PX, INNER_H_PX) if crop_bleed else (BLEED_W_PX, BLEED_H_PX)
+        try:
+            with Image.open(img_path) as im:
+                conformant = (im.size == target_px and im.mode == "RGB" and "transparency" not in im.info)
+            if conformant:
+                _CONVERT_CACHE[cache_key] = img_path
+                _IMG_SIZE_CACHE[str(img_path)] = target_px
+                _dbg("[DEBUG] %s: already %sx%s -> embedded as is", img_path.name, target_px[0], target_px[1])
+                return img_path
+        except Exception:
+            pass
 
     try:
         with Image.open(img_path) as im:
-            _dbg(f"[DEBUG] {img_path.name}: opened {im.width}x{im.height}, mode={im.mode}, crop_bleed={crop_bleed}, quality={quality_key}, dpi={dpi}")
-
-            # transparency -> white background
-            if im.mode in ("RGBA", "LA") or ("transparency" in im.info):
-                base = Image.new("RGB", im.size, (255, 255, 255))
-                im_rgba = im.convert("RGBA")
-                base.paste(im_rgba, mask=im_rgba.split()[-1])
-                im = base
-            else:
-                im = im.convert("RGB")
+            _dbg("[DEBUG] %s: opened %sx%s, mode=%s, crop_bleed=%s, quality=%s, dpi=%s", img_path.name, im.width, im.height, im.mode, crop_bleed, quality_key, dpi)
 
+            # Erst nur die Geometrie bestimmen; Farbkonvertierung erst NACH dem Crop,
+            # damit große Scans (z. B. 6000x8400) nicht komplett nach RGB gewandelt werden.
+            upscale = False
             if crop_bleed:
                 # Target INNER (750x1050). NEVER aspect-crop to bleed ratio here.
+                # Erst das Quell-Rechteck bestimmen, dann EIN crop- bzw. resize(box=...)-Durchlauf
+                # (keine Zwischenbilder pro Schritt).
+                left, top, right, bottom = 0, 0, im.width, im.height
 
                 if im.width == BLEED_W_PX and im.height == BLEED_H_PX:
                     # exact bleed canvas -> remove fixed borders
-                    im = im.crop((BLEED_LEFT_TOP_PX, BLEED_LEFT_TOP_PX,
-                                  im.width - BLEED_RIGHT_BOTTOM_PX,
-                                  im.height - BLEED_RIGHT_BOTTOM_PX))
-                    _dbg(f"[DEBUG]   after fixed-bleed-crop: {im.width}x{im.height}")
+                    left, top = BLEED_LEFT_TOP_PX, BLEED_LEFT_TOP_PX
+                    right = im.width - BLEED_RIGHT_BOTTOM_PX
+                    bottom = im.height - BLEED_RIGHT_BOTTOM_PX
+                    _dbg("[DEBUG]   after fixed-bleed-crop: %sx%s", right - left, bottom - top)
 
                 elif im.width >= BLEED_W_PX and im.height >= BLEED_H_PX:
                     # larger-than-bleed exports -> proportional border crop, then enforce INNER
-                    left = int(round(im.width * (BLEED_LEFT_TOP_PX / BLEED_W_PX)))
-                    top = int(round(im.height * (BLEED_LEFT_TOP_PX / BLEED_H_PX)))
-                    right = im.width - int(round(im.width * (BLEED_RIGHT_BOTTOM_PX / BLEED_W_PX)))
-                    bottom = im.height - int(round(im.height * (BLEED_RIGHT_BOTTOM_PX / BLEED_H_PX)))
-                    im = im.crop((left, top, right, bottom))
-                    _dbg(f"[DEBUG]   after proportional-bleed-crop: {im.width}x{im.height}")
+                    fl, ft, fr, fb = BLEED_CROP_FRAC
+                    left = round(im.width * fl)
+                    top = round(im.height * ft)
+                    right = im.width - round(im.width * fr)
+                    bottom = im.height - round(im.height * fb)
+                    _dbg("[DEBUG]   after proportional-bleed-crop: %sx%s", right - left, bottom - top)
 
                 # If we're still larger than INNER, center-crop to exact INNER.
-                if im.width >= INNER_W_PX and im.height >= INNER_H_PX and (im.width != INNER_W_PX or im.height != INNER_H_PX):
-                    im = _center_crop_exact(im, INNER_W_PX, INNER_H_PX)
-                    _dbg(f"[DEBUG]   after inner-enforce: {im.width}x{im.height}")
+                box_w, box_h = right - left, bottom - top
+                if box_w >= INNER_W_PX and box_h >= INNER_H_PX and (box_w != INNER_W_PX or box_h != INNER_H_PX):
+                    left += (box_w - INNER_W_PX) // 2
+                    top += (box_h - INNER_H_PX) // 2
+                    right, bottom = left + INNER_W_PX, top + INNER_H_PX
+                    _dbg("[DEBUG]   after inner-enforce: %sx%s", INNER_W_PX, INNER_H_PX)
 
                 # If image is already exactly INNER, it stays unchanged.
                 # NEW: If image is smaller than INNER, upscale (stretch) to exact INNER size.
                 # This avoids aborting on small images and ensures consistent placement.
-                if im.width < INNER_W_PX or im.height < INNER_H_PX:
-                    im = im.resize((INNER_W_PX, INNER_H_PX), resample=Image.LANCZOS)
-                    _dbg(f"[DEBUG] after upscaling to INNER: {im.width}x{im.height}")
-
+                upscale = (right - left) < INNER_W_PX or (bottom - top) < INNER_H_PX
 
             else:
                 # Target BLEED (825x1125). Keep bleed; ratio-fix only if necessary.
+                # Bleed-Enforce und Ratio-Fix ergeben zusammen EIN Crop-Rechteck.
+                left, top, right, bottom = 0, 0, im.width, im.height
 
                 if im.width >= BLEED_W_PX and im.height >= BLEED_H_PX and (im.width != BLEED_W_PX or im.height != BLEED_H_PX):
-                    im = _center_crop_exact(im, BLEED_W_PX, BLEED_H_PX)
-                    _dbg(f"[DEBUG]   after bleed-enforce: {im.width}x{im.height}")
+                    left = (im.width - BLEED_W_PX) // 2
+                    top = (im.height - BLEED_H_PX) // 2
+                    right, bottom = left + BLEED_W_PX, top + BLEED_H_PX
+                    _dbg("[DEBUG]   after bleed-enforce: %sx%s", BLEED_W_PX, BLEED_H_PX)
 
                 # If aspect ratio is off, center-crop to the bleed aspect ratio (11:15).
-                if im.width * BLEED_H_PX != im.height * BLEED_W_PX:
+                box_w, box_h = right - left, bottom - top
+                if box_w * BLEED_H_PX != box_h * BLEED_W_PX:
                     target_ratio = BLEED_W_PX / BLEED_H_PX
-                    current_ratio = im.width / im.height if im.height else target_ratio
+                    current_ratio = box_w / box_h if box_h else target_ratio
                     if current_ratio > target_ratio:
-                        new_w = int(round(im.height * target_ratio))
-                        left = (im.width - new_w) // 2
-                        im = im.crop((left, 0, left + new_w, im.height))
+                        new_w = int(round(box_h * target_ratio))
+                        left += (box_w - new_w) // 2
+                        right = left + new_w
                     else:
-                        new_h = int(round(im.width / target_ratio))
-                        top = (im.height - new_h) // 2
-                        im = im.crop((0, top, im.width, top + new_h))
-                    _dbg(f"[DEBUG]   after ratio-fix (bleed): {im.width}x{im.height}")
+                        new_h = int(round(box_w / target_ratio))
+                        top += (box_h - new_h) // 2
+                        bottom = top + new_h
+                    _dbg("[DEBUG]   after ratio-fix (bleed): %sx%s", right - left, bottom - top)
+
+            box = (left, top, right, bottom)
+            if quality_key != "lossless" and not upscale:
+                box = _draft_jpeg_for_box(im, box, *target_pixels_for_box_inches(w_in, h_in, dpi))
+            if upscale:
+                im = _flatten_to_rgb(im).resize((INNER_W_PX, INNER_H_PX), resample=_upscale_filter(right - left, bottom - top), box=box)
+                _dbg("[DEBUG] after upscaling to INNER: %sx%s", im.width, im.height)
+            else:
+                if box != (0, 0, im.width, im.height):
+                    im = im.crop(box)
+                im = _flatten_to_rgb(im)
 
             if quality_key == "lossless":
-                im.save(out_file, "PNG", optimize=True)
+                _save_atomic(im, out_file, "PNG", optimize=True)
+                _IMG_SIZE_CACHE[str(out_file)] = im.size
                 _CONVERT_CACHE[cache_key] = out_file
-                _dbg(f"[DEBUG]   saved lossless: {out_file.name} -> {im.width}x{im.height}")
+                _dbg("[DEBUG]   saved lossless: %s -> %sx%s", out_file.name, im.width, im.height)
                 return out_file
 
             target_w, target_h = target_pixels_for_box_inches(w_in, h_in, dpi)
-            _dbg(f"[DEBUG]   target pixels: {target_w}x{target_h}")
+            _dbg("[DEBUG]   target pixels: %sx%s", target_w, target_h)
             if im.width > target_w or im.height > target_h:
-                im.thumbnail((target_w, target_h), resample=Image.LANCZOS)
-                _dbg(f"[DEBUG]   after thumbnail: {im.width}x{im.height}")
-            im.save(out_file, "JPEG", quality=jpeg_q, optimize=True)
-            _dbg(f"[DEBUG]   saved jpeg: {out_file.name} -> {im.width}x{im.height}")
+                im.thumbnail((target_w, target_h), resample=_RESAMPLE_DOWN)
+                _dbg("[DEBUG]   after thumbnail: %sx%s", im.width, im.height)
+            _save_preprocessed_jpeg(im, out_file, jpeg_q)
+            _dbg("[DEBUG]   saved jpeg: %s -> %sx%s", out_file.name, im.width, im.height)
 
     except Exception as e:
         _CONVERT_CACHE[cache_key] = img_path
-        _dbg(f"[DEBUG]   ERROR preprocessing {img_path.name}: {e}")
+        _dbg("[DEBUG]   ERROR preprocessing %s: %s", img_path.name, e)
         return img_path
 
     _CONVERT_CACHE[cache_key] = out_file
@@ -1468,6 +1875,23 @@ def preprocess_card_image_outer_bleed(
     keep_top_px: int,
     keep_bottom_px: int,
     rotate_degrees: int = 0
+) -> Path:
+    key = ("outerbleed", str(img_path), quality_key, keep_left_px, keep_right_px, keep_top_px, keep_bottom_px, rotate_degrees)
+    out = _PREPROCESS_MEMO.get(key)
+    if out is None:
+        out = _PREPROCESS_MEMO[key] = _preprocess_card_image_outer_bleed(
+            img_path, quality_key, keep_left_px, keep_right_px, keep_top_px, keep_bottom_px, rotate_degrees
+        )
+    return out
+
+def _preprocess_card_image_outer_bleed(
+    img_path: Path,
+    quality_key: str,
+    keep_left_px: int,
+    keep_right_px: int,
+    keep_top_px: int,
+    keep_bottom_px: int,
+    rotate_degrees: int = 0
 ) -> Path:
     """
     Erzeugt ein Bild, dessen Innenfläche exakt INNER_W/H_PX bleibt, aber an
@@ -1477,16 +1901,17 @@ def preprocess_card_image_outer_bleed(
     Optionales rotieren (0/180) z. B. für Gutterfold-Rückseiten.
     """
     preset = QUALITY_PRESETS.get(quality_key, QUALITY_PRESETS["high"])
+    dpi = preset["dpi"]
     jpeg_q = preset["jpeg_quality"]
 
     cache_key = (
-        str(img_path.resolve()),
+        _resolved_str(img_path),
         quality_key,
         f"outerbleed:{keep_left_px}-{keep_right_px}-{keep_top_px}-{keep_bottom_px}",
         f"rot{rotate_degrees}"
     )
     cached = _CONVERT_CACHE.get(cache_key)
-    if cached and cached.exists():
+    if cached and _preprocessed_available(cached):
         return cached
 
     if Image is None:
@@ -1495,27 +1920,21 @@ def preprocess_card_image_outer_bleed(
 
     try:
         with Image.open(img_path) as im:
-            # Transparenz -> Weiß
-            if im.mode in ("RGBA", "LA") or ("transparency" in im.info):
-                base = Image.new("RGB", im.size, (255, 255, 255))
-                im_rgba = im.convert("RGBA")
-                base.paste(im_rgba, mask=im_rgba.split()[-1])
-                im = base
-            else:
-                im = im.convert("RGB")
-
-            # Optional vorverarbeiten: 0/180 Grad
-            if rotate_degrees % 360 != 0:
-                im = im.rotate(rotate_degrees % 360, expand=True)
+            # 0/180 Grad ändern die Maße nicht: Geometrie wie am gedrehten Bild bestimmen und erst
+            # das fertige (kleine) Ergebnis drehen. Andere Winkel: wie bisher vorab drehen.
+            rot = rotate_degrees % 360
+            if rot not in (0, 180):
+                im = _flatten_to_rgb(im).rotate(rot, expand=True)
+                rot = 0
+            src_w, src_h = im.size
 
-            has_bleed = (im.width >= BLEED_W_PX and im.height >= BLEED_H_PX)
+            has_bleed = (src_w >= BLEED_W_PX and src_h >= BLEED_H_PX)
+            resample = _RESAMPLE_DOWN
 
             if has_bleed:
                 # Auf exakte Bleed-Canvas zentriert bringen
-                if im.width != BLEED_W_PX or im.height != BLEED_H_PX:
-                    left = (im.width - BLEED_W_PX) // 2
-                    top  = (im.height - BLEED_H_PX) // 2
-                    im = im.crop((left, top, left + BLEED_W_PX, top + BLEED_H_PX))
+                left = (src_w - BLEED_W_PX) // 2
+                top  = (src_h - BLEED_H_PX) // 2
 
                 # Standardmäßig würdest du 37/38 px abschneiden -> wir lassen an Außenkanten etwas stehen.
                 l_cut = max(0, BLEED_LEFT_TOP_PX   - min(keep_left_px,   BLEED_LEFT_TOP_PX))
@@ -1523,38 +1942,65 @@ def preprocess_card_image_outer_bleed(
                 r_cut = max(0, BLEED_RIGHT_BOTTOM_PX - min(keep_right_px,  BLEED_RIGHT_BOTTOM_PX))
                 b_cut = max(0, BLEED_RIGHT_BOTTOM_PX - min(keep_bottom_px, BLEED_RIGHT_BOTTOM_PX))
 
-                im = im.crop((l_cut, t_cut, im.width - r_cut, im.height - b_cut))
-
                 # Zielgröße inkl. stehen gelassenem Bleed
                 target_w = INNER_W_PX + min(keep_left_px, BLEED_LEFT_TOP_PX) + min(keep_right_px, BLEED_RIGHT_BOTTOM_PX)
                 target_h = INNER_H_PX + min(keep_top_px,  BLEED_LEFT_TOP_PX) + min(keep_bottom_px, BLEED_RIGHT_BOTTOM_PX)
 
-                # Falls größer -> zentriert auf Ziel beschneiden
-                if im.width > target_w or im.height > target_h:
-                    cx = (im.width  - target_w) // 2
-                    cy = (im.height - target_h) // 2
-                    im = im.crop((cx, cy, cx + target_w, cy + target_h))
-
-                # Falls kleiner/abweichend -> exakt auf Ziel skalieren
-                if im.width != target_w or im.height != target_h:
-                    im = im.resize((target_w, target_h), resample=Image.LANCZOS)
+                # Zentrieren, Bleed-Schnitt und ggf. Zentrierung auf Ziel in EIN Quell-Rechteck
+                box = (left + l_cut, top + t_cut,
+                       left + BLEED_W_PX - r_cut, top + BLEED_H_PX - b_cut)
+                bw, bh = box[2] - box[0], box[3] - box[1]
+                if bw > target_w or bh > target_h:
+                    cx = (bw - target_w) // 2
+                    cy = (bh - target_h) // 2
+                    box = (box[0] + cx, box[1] + cy, box[0] + cx + target_w, box[1] + cy + target_h)
             else:
                 # Kein Bleed -> Innenmaß erzwingen
-                if im.width >= INNER_W_PX and im.height >= INNER_H_PX:
-                    cx = (im.width  - INNER_W_PX) // 2
-                    cy = (im.height - INNER_H_PX) // 2
-                    im = im.crop((cx, cy, cx + INNER_W_PX, cy + INNER_H_PX))
+                target_w, target_h = INNER_W_PX, INNER_H_PX
+                if src_w >= INNER_W_PX and src_h >= INNER_H_PX:
+                    cx = (src_w  - INNER_W_PX) // 2
+                    cy = (src_h - INNER_H_PX) // 2
+                    box = (cx, cy, cx + INNER_W_PX, cy + INNER_H_PX)
                 else:
-                    im = im.resize((INNER_W_PX, INNER_H_PX), resample=Image.LANCZOS)
+                    box = (0, 0, src_w, src_h)
+                    resample = _upscale_filter(src_w, src_h)
+
+            if quality_key != "lossless" and dpi < TEMPLATE_DPI:
+                # Wie bei preprocess_card_image_for_pdf: verlustbehaftet auf die Preset-DPI
+                # herunterrechnen. Das Innenmaß entspricht TEMPLATE_DPI; die Zeichengeometrie
+                # (draw_card_outer_bleed) hängt nur von INNER_*_PX/keep_* ab, nicht von der Pixelgröße.
+                scale = dpi / float(TEMPLATE_DPI)
+                target_w, target_h = max(1, int(round(target_w * scale))), max(1, int(round(target_h * scale)))
+
+            if rot == 180:
+                # Rechteck des gedrehten Bildes im ungedrehten Original
+                box = (src_w - box[2], src_h - box[3], src_w - box[0], src_h - box[1])
+
+            # Crop und Skalierung in EINEM Durchlauf (resize(box=...)), kein Zwischenbild je Schritt
+            if (box[2] - box[0], box[3] - box[1]) == (target_w, target_h):
+                if box != (0, 0, src_w, src_h):
+                    im = im.crop(box)
+                im = _flatten_to_rgb(im)
+            else:
+                # Palette/Transparenzfarbe vor dem Resampling auflösen (sonst NEAREST bzw. Farbsäume)
+                if im.mode in ("P", "1") or "transparency" in im.info:
+                    im = _flatten_to_rgb(im)
+                im = _flatten_to_rgb(im.resize((target_w, target_h), resample=resample, box=box))
+
+            if rot == 180:
+                im = im.transpose(Image.ROTATE_180)
 
             # Ausgabe (lossless PNG, sonst JPEG)
-            h = hashlib.md5("".join(map(str, cache_key)).encode("utf-8")).hexdigest()
             ext = ".png" if quality_key == "lossless" else ".jpg"
-            out_file = TMP_DIR / f"{img_path.stem}_outerbleed_{h}{ext}"
+            out_file = TMP_DIR / (
+                f"{img_path.stem}_{_source_file_hash(cache_key[0])}_outerbleed_{quality_key}_{INNER_W_PX}x{INNER_H_PX}_"
+                f"{keep_left_px}-{keep_right_px}-{keep_top_px}-{keep_bottom_px}_rot{rotate_degrees}{ext}"
+            )
             if quality_key == "lossless":
-                im.save(out_file, "PNG", optimize=True)
+                _save_atomic(im, out_file, "PNG", optimize=True)
+                _IMG_SIZE_CACHE[str(out_file)] = im.size
             else:
-                im.save(out_file, "JPEG", quality=jpeg_q, optimize=True)
+                _save_preprocessed_jpeg(im, out_file, jpeg_q)
 
             _CONVERT_CACHE[cache_key] = out_file
             return out_file
@@ -1562,6 +2008,32 @@ def preprocess_card_image_outer_bleed(
         _CONVERT_CACHE[cache_key] = img_path
         return img_path
 
+# Zeichengeometrie je (Kartenbox, keep_*, Innenmaß): hängt nicht vom Bild ab und ist für ein
+# ganzes Layout gleich -> einmal rechnen statt pro Karte
+_OUTER_BLEED_PLAN: Dict[tuple, Tuple[float, float, float, float]] = {}
+
+def _outer_bleed_plan(card_w: float, card_h: float,
+                      keep_left_px: int, keep_right_px: int,
+                      keep_top_px: int, keep_bottom_px: int) -> Tuple[float, float, float, float]:
+    """(total_w, total_h, dx_off, dy_off) für draw_card_outer_bleed."""
+    key = (card_w, card_h, keep_left_px, keep_right_px, keep_top_px, keep_bottom_px, INNER_W_PX, INNER_H_PX)
+    plan = _OUTER_BLEED_PLAN.get(key)
+    if plan is None:
+        # Innenfläche muss exakt die Kartenbox füllen – so bleibt Außen-Bleed sichtbar.
+        # Kleinste Rundungsunterschiede zwischen px- und pt-Geometrie dürfen
+        # den Außen-Bleed nicht "auffressen".
+        s_w = card_w / float(INNER_W_PX)
+        s_h = card_h / float(INNER_H_PX)
+        # Priorisiere Breite; wenn die Höhenabweichung spürbar wird, nimm Höhe:
+        s = s_w
+        if abs((s * INNER_H_PX) - card_h) > 0.5:  # Toleranz ~0,5 pt
+            s = s_h
+        total_w = s * (INNER_W_PX + keep_left_px + keep_right_px)
+        total_h = s * (INNER_H_PX + keep_top_px + keep_bottom_px)
+        # Außen-Bleed ragt aus dem Grid heraus
+        plan = _OUTER_BLEED_PLAN[key] = (total_w, total_h, s * keep_left_px, s * keep_bottom_px)
+    return plan
+
 # Zeichnen mit exakter Innen-Mapping-Skalierung, Bleed steht außen
 def draw_card_outer_bleed(
     c: canvas.Canvas,
@@ -1571,26 +2043,12 @@ def draw_card_outer_bleed(
     keep_left_px: int, keep_right_px: int,
     keep_top_px: int, keep_bottom_px: int
 ):
-    # Innenfläche muss exakt die Kartenbox füllen – so bleibt Außen-Bleed sichtbar.
-    # Kleinste Rundungsunterschiede zwischen px- und pt-Geometrie dürfen
-    # den Außen-Bleed nicht "auffressen".
-    s_w = card_w / float(INNER_W_PX)
-    s_h = card_h / float(INNER_H_PX)
-    # Priorisiere Breite; wenn die Höhenabweichung spürbar wird, nimm Höhe:
-    s = s_w
-    if abs((s * INNER_H_PX) - card_h) > 0.5:  # Toleranz ~0,5 pt
-        s = s_h
-    total_w = s * (INNER_W_PX + keep_left_px + keep_right_px)
-    total_h = s * (INNER_H_PX + keep_top_px + keep_bottom_px)
-
-    # Außen-Bleed ragt aus dem Grid heraus
-    dx = x - s * keep_left_px
-    dy = y - s * keep_bottom_px
-
-
+    total_w, total_h, dx_off, dy_off = _outer_bleed_plan(
+        card_w, card_h, keep_left_px, keep_right_px, keep_top_px, keep_bottom_px
+    )
     c.drawImage(
-        ImageReader(str(processed_path)),
-        dx, dy,
+        get_image_reader(processed_path),
+        x - dx_off, y - dy_off,
         width=total_w, height=total_h,
         preserveAspectRatio=True, mask="auto"
     )
@@ -1615,15 +2073,11 @@ def analyze_card_images(pairs: List[Tuple[str, Optional[Path], Optional[Path]]])
     sizes = {}
     too_small = []
     too_small_bleed = []
-    # cache sizes
+    # cache sizes (header-only read, PIL only as fallback)
     def get_size(p: Path):
         if p in sizes:
             return sizes[p]
-        try:
-            with Image.open(p) as im:
-                sizes[p] = im.size
-        except Exception:
-            sizes[p] = (0, 0)
+        sizes[p] = get_image_px_size(p) or (0, 0)
         return sizes[p]
 
     # check minimum size and build bleed eligible list
@@ -1632,7 +2086,7 @@ def analyze_card_images(pairs: List[Tuple[str, Optional[Path], Optional[Path]]])
     for base, a, b in pairs:
         # minimum check
         for p in (a, b):
-            if p is None or not p.exists():
+            if not image_exists(p):
                 continue
             w, h = get_size(p)
             if w < INNER_W_PX or h < INNER_H_PX:
@@ -1643,7 +2097,7 @@ def analyze_card_images(pairs: List[Tuple[str, Optional[Path], Optional[Path]]])
         # 2x3 eligibility: all existing sides must have bleed dimensions
         ok_bleed = True
         for p in (a, b):
-            if p is None or not p.exists():
+            if not image_exists(p):
                 continue
             w, h = get_size(p)
             if w < BLEED_W_PX or h < BLEED_H_PX:
@@ -1666,6 +2120,7 @@ def _q_select(title: str, choices, default):
     - liefert bei None/leerem String immer den Default zurück
     - 'choices' und 'default' können Strings oder questionary.Choice sein
     """
+    questionary = _get_questionary()
     if questionary is None:
         return default
     try:
@@ -1688,7 +2143,7 @@ def prompt_layout_dynamic(args=None) -> List[str]:
             return ["gutterfold"]
         print(t("invalid_layout"))
     # 2) Komfort: List-Prompt (falls questionary vorhanden)
-    if questionary is not None:
+    if _get_questionary() is not None:
         # Titel lokalisiert; Choices bleiben sprachneutral, da die Logik auf diese Keys mappt
         q_title = t("choose_layout", opts="Standard/Bleed/Gutterfold/All")   
         picked = _q_select(q_title, choices=["All", "Standard", "Bleed", "Gutterfold"], default="All")
@@ -1729,7 +2184,7 @@ def prompt_pagesize_mode(args=None):
             return [(A4,"_A4"), (letter,"_Letter")]
         print(t("invalid_format"))
     # 2) Komfort: List-Prompt (falls questionary vorhanden)
-    if questionary is not None:
+    if _get_questionary() is not None:
         q_title = t("choose_format")
         picked = _q_select(q_title, choices=["Both","A4","Letter"], default="Both")
         if str(picked) == "A4":
@@ -1778,6 +2233,7 @@ def prompt_quality(args=None) -> str:
             return "low"
         # Ungültige CLI-Eingabe -> weiter zum Prompt
     # 2) Komfort: questionary-Select (lokalisierter Titel)
+    questionary = _get_questionary()
     if questionary is not None:
         q_title = t("ask_quality")
         # Choices als Objekte erstellen und **dasselbe Objekt** als default verwenden
@@ -1830,6 +2286,18 @@ def prompt_output_base(default_base: str) -> str:
 # =========================================================
 # Card pairing
 # =========================================================
+# Beide Namensschemata in EINEM Muster (einmal kompiliert, ein Match je Datei):
+# - New scheme: base[face,NNN] OR base[back,NNN] -> Gruppen bbase/kind/num
+#   Wichtig: base = alles VOR der ersten Klammer!
+# - Legacy: ...a / ...b -> Gruppen abase/side
+#   (Trennzeichen-Klasse bewusst unverändert übernommen: [\_\\-\\s] trifft "_", "\" und "s")
+# Ein Stem endet entweder auf "]" oder auf a/b, kann also nie beide Alternativen treffen.
+_CARD_NAME_RE = re.compile(
+    r"^(?:(?P<bbase>.*?)\[(?P<kind>face|back),(?P<num>\d{1,3})\]"
+    r"|(?P<abase>.*?)(?:[\_\\-\\s]?)(?P<side>[ab]))$",
+    re.IGNORECASE,
+)
+
 def find_card_pairs(folder: Path) -> List[Tuple[str, Optional[Path], Optional[Path]]]:
     """
     Find and pair card front/back images – with count support.
@@ -1841,120 +2309,69 @@ def find_card_pairs(folder: Path) -> List[Tuple[str, Optional[Path], Optional[Pa
     - Legacy '...a'/'...b': Count = 1 (wie bisher).
     Rückgabe ist eine expandierte Liste, in der jedes Tupel eine physische Karte repräsentiert.
     """
-    files = [p for p in folder.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_EXT]
+    # os.scandir liefert is_file() aus dem Verzeichniseintrag (kein extra stat() pro Datei);
+    # je Datei nur (Name, Stem, Pfad) merken, Path-Objekte erst für tatsächliche Treffer bauen
+    files: List[Tuple[str, str, str]] = []
+    with os.scandir(folder) as it:
+        for e in it:
+            stem, ext = os.path.splitext(e.name)
+            if ext.lower() in SUPPORTED_EXT and e.is_file():
+                files.append((e.name, stem, e.path))
     # Deterministic processing order: sort files alphanumerically (natural sort)
-    def _nat_key(s: str):
-        parts = re.split(r'(\d+)', (s or '').lower())
-        return [int(p) if p.isdigit() else p for p in parts]
-    files.sort(key=lambda p: _nat_key(p.name))
-
-    # Patterns
-    # Legacy: ...a / ...b
-    # ab_pattern = re.compile(r"^(.*?)(?:[_\-\s]?)([ab])$", re.IGNORECASE)
-    ab_pattern = re.compile(r"^(.*?)(?:[\_\\-\\s]?)([ab])$", re.IGNORECASE)
-
-    # New scheme: base[face,NNN] OR base[back,NNN]
-    # Wichtig: base = alles VOR der ersten Klammer!
-    bracket_pattern = re.compile(r"^(.*?)\[(face|back),(\d{1,3})\]$", re.IGNORECASE)
-
-    # Map: base -> entry
-    # Wichtig: NUM wird nicht mehr zum Key!
-    pairs_map: Dict[str, Dict[str, object]] = {}
-
-    for f in files:
-        stem = f.stem
-
-        m2 = bracket_pattern.match(stem)
-        if m2:
-            base = m2.group(1)                 # nur VOR der Klammer
-            kind = m2.group(2).lower()         # face/back
-            num_raw = m2.group(3)              # NNN (1–3 digits)
-            count_val = max(1, min(int(num_raw), 999))
-
-            key = base.lower()                 # KEY = NUR DER BASENAME
-
-            entry = pairs_map.setdefault(key, {
-                'base': base,
-                'num': None,
-                'face': None,
-                'back': None,
-                'face_count': None,
-                'back_count': None,
-            })
-            if kind == 'face':
-                entry['face'] = f
-                entry['face_count'] = count_val
-            else:
-                entry['back'] = f
-                entry['back_count'] = count_val
-            continue
-
-    # Legacy-Schema separat, damit "base__NNN" Keys nicht mit "base" kollidieren
-    for f in files:
-        m1 = ab_pattern.match(f.stem)
-        if not m1:
+    files.sort(key=lambda f: _alnum_key(f[0]))
+
+    # Ein Durchlauf sammelt (key, base, side, Datei, count) – Bracket-Treffer vor Legacy-Treffern,
+    # damit "base__NNN" Keys nicht mit "base" kollidieren (später gewinnt wie bisher).
+    # Wichtig: KEY = NUR DER BASENAME (kleingeschrieben), NNN wird nicht zum Key!
+    bracket_entries: List[Tuple[str, str, str, Path, int]] = []
+    ab_entries: List[Tuple[str, str, str, Path, int]] = []
+    match = _CARD_NAME_RE.match
+    for _name, stem, path in files:
+        m = match(stem)
+        if m is None:
             continue
-        base = m1.group(1)
-        side = m1.group(2).lower()
-        key = base.lower()
-        entry = pairs_map.setdefault(key, {
-            'base': base,
-            'num': None,
-            'face': None,
-            'back': None,
-            'face_count': None,
-            'back_count': None,
-        })
-        if side == 'a':
-            entry['face'] = f
-            entry['face_count'] = 1
+        kind = m.group('kind')
+        if kind is not None:
+            base = m.group('bbase')            # nur VOR der Klammer
+            count_val = max(1, min(int(m.group('num')), 999))
+            bracket_entries.append((base.lower(), base, kind.lower(), Path(path), count_val))
         else:
-            entry['back'] = f
-            entry['back_count'] = 1
-
-    # Sortierung: base (case-insensitiv)
-    def sort_key(item):
-        return _nat_key(str(item[1].get('base', '')))
+            base = m.group('abase')
+            side = 'face' if m.group('side').lower() == 'a' else 'back'
+            ab_entries.append((base.lower(), base, side, Path(path), 1))
+    entries = bracket_entries + ab_entries
+
+    # key -> [Sortierschlüssel, base, face, back, face_count, back_count]
+    # (base und Sortierschlüssel vom ersten Treffer, einmal berechnet)
+    groups: Dict[str, list] = {}
+    for key, base, side, f, count_val in entries:
+        g = groups.get(key)
+        if g is None:
+            g = groups[key] = [_alnum_key(base), base, None, None, None, None]
+        if side == 'face':
+            g[2], g[4] = f, count_val
+        else:
+            g[3], g[5] = f, count_val
 
     expanded: List[Tuple[str, Optional[Path], Optional[Path]]] = []
 
-    for _key, d in sorted(pairs_map.items(), key=sort_key):
-        base = str(d.get('base', ''))
-        num = d.get('num')
-        face: Optional[Path] = d.get('face')  # type: ignore
-        back: Optional[Path] = d.get('back')  # type: ignore
-        face_count = d.get('face_count') if isinstance(d.get('face_count'), int) else None
-        back_count = d.get('back_count') if isinstance(d.get('back_count'), int) else None
-
-        # Defaults
-        if face and not face_count:
-            face_count = 1
-        if back and not back_count:
-            back_count = 1
-
+    # Sortierung: base (case-insensitiv, natürlich)
+    for _sk, base, face, back, face_count, back_count in sorted(groups.values(), key=lambda g: g[0]):
         # Count-Regeln
         if face and back:
-            if face_count and back_count and face_count != back_count:
-                use_count = face_count or 1
-                # Lokalisierte Warnung
-                print(t("count_mismatch_warn", base=base, face=face_count, back=back_count, use=use_count))
-                count_to_use = use_count
-            else:
-                count_to_use = face_count or back_count or 1
-        elif face and not back:
-            count_to_use = face_count or 1
-        elif back and not face:
-            count_to_use = back_count or 1
+            if face_count != back_count:
+                # Lokalisierte Warnung; Face-Count gewinnt
+                print(t("count_mismatch_warn", base=base, face=face_count, back=back_count, use=face_count))
+            count_to_use = face_count
+        elif face:
+            count_to_use = face_count
+        elif back:
+            count_to_use = back_count
         else:
             continue  # weder Face noch Back
 
         # Display name ohne NNN
-        display_name = base
-        count_to_use = max(1, int(count_to_use))
-        for _ in range(count_to_use):
-            expanded.append((display_name,
-                             face if (face and face.exists()) else face,
-                             back  if (back  and back.exists())  else back))
+        expanded.extend([(base, face, back)] * count_to_use)
     return expanded
 
 def find_card_pairs_recursive(root: Path) -> List[Tuple[str, Optional[Path], Optional[Path]]]:
@@ -1984,8 +2401,12 @@ def find_named_image_in_folder(folder: Path, basename: str) -> Optional[Path]:
         return None
     want_l = want.lower()
     ext_rank = {'.png': 0, '.jpg': 1, '.jpeg': 2}
-    candidates = [p for p in folder.iterdir()
-                  if p.is_file() and p.suffix.lower() in SUPPORTED_EXT and p.stem.lower() == want_l]
+    with os.scandir(folder) as it:
+        candidates = []
+        for e in it:
+            stem, ext = os.path.splitext(e.name)
+            if ext.lower() in SUPPORTED_EXT and stem.lower() == want_l and e.is_file():
+                candidates.append(Path(e.path))
     if not candidates:
         return None
     candidates.sort(key=lambda p: (ext_rank.get(p.suffix.lower(), 9), p.name.lower()))
@@ -1999,33 +2420,37 @@ def find_rulebook_images(folder: Path, basename: str) -> List[Path]:
     if not basename:
         return []
     want = basename.strip().lower()
-    files = [
-        p for p in folder.iterdir()
-        if p.is_file() and p.suffix.lower() in SUPPORTED_EXT and p.stem.lower().startswith(want)
-    ]
-    def _alnum_key(p: Path):
-        import re
-        parts = re.split(r'(\d+)', p.name.lower())
-        return [int(s) if s.isdigit() else s for s in parts]
-    return sorted(files, key=_alnum_key)
+    files = []
+    with os.scandir(folder) as it:
+        for e in it:
+            stem, ext = os.path.splitext(e.name)
+            if ext.lower() in SUPPORTED_EXT and stem.lower().startswith(want) and e.is_file():
+                files.append(Path(e.path))
+    return sorted(files, key=lambda p: _alnum_key(p.name))
 
 def chunk(lst, n):
     for i in range(0, len(lst), n):
         yield lst[i:i + n]
 
+def split_sheet_sides(pairs, per_page: int, include_back_pages: bool):
+    """
+    Pro Bogen einmal: (fronts, backs, has_backs) – Vorder-/Rückseiten auf per_page aufgefüllt,
+    has_backs = es gibt eine Rückseite für diesen Bogen.
+    """
+    sheets = []
+    for group in chunk(pairs, per_page):
+        fill = [None] * (per_page - len(group))
+        fronts = [a for (_n, a, _b) in group] + fill
+        backs = [b for (_n, _a, b) in group] + fill
+        sheets.append((fronts, backs, include_back_pages and any(image_exists(p) for p in backs)))
+    return sheets
+
 
 # =========================================================
 # Placement helpers
 # =========================================================
 def fit_image_into_box(img_path: Path, box_w: float, box_h: float) -> Tuple[float, float]:
-    size = get_image_px_size(img_path)
-    if not size:
-        return box_w, box_h
-    iw, ih = size
-    if iw <= 0 or ih <= 0:
-        return box_w, box_h
-    scale = min(box_w / iw, box_h / ih)
-    return iw * scale, ih * scale
+    return _fit_image_into_box_rotated(img_path, box_w, box_h, 0)
 
 def fit_logo_with_constraints(logo_path: Path, max_w: float, max_h: float) -> Tuple[float, float]:
     size = get_image_px_size(logo_path)
@@ -2055,8 +2480,7 @@ def draw_rulebook_pages(c: canvas.Canvas, pagesize_tuple, image_paths: List[Path
     page_w, page_h = pagesize_tuple
     for p in image_paths:
         try:
-            if not p.exists():
-                continue
+            # Kein exists()-Vorabtest: fehlt die Datei, wirft ImageReader unten OSError -> übersprungen
             # --- Per-Image Rotation abhängig vom Ziel-Layout ---
             # Regeln:
             #   - landscape_pref (Bleed/Gutterfold): rotate 90° rechts, wenn Höhe > Breite
@@ -2067,8 +2491,6 @@ def draw_rulebook_pages(c: canvas.Canvas, pagesize_tuple, image_paths: List[Path
             size = get_image_px_size(p)
             if size:
                 iw, ih = float(size[0]), float(size[1])
-            # Default: keine Rotation, direkter Reader
-            img_reader = ImageReader(str(p))
 
             def _need_rotate_clockwise(iw_f: float, ih_f: float, mode_s: str) -> bool:
                 if iw_f is None or ih_f is None:
@@ -2125,8 +2547,10 @@ def draw_rulebook_pages(c: canvas.Canvas, pagesize_tuple, image_paths: List[Path
             dx = (page_w - draw_w_pt) / 2.0
             dy = (page_h - draw_h_pt) / 2.0
 
+            # Default: keine Rotation, direkter Reader – erst hier angelegt, damit gedrehte Seiten
+            # die Datei nicht zusätzlich für einen ungenutzten Reader einlesen
             c.drawImage(
-                rotated_reader or img_reader,
+                rotated_reader or get_image_reader(p),
                 dx, dy,
                 width=draw_w_pt,
                 height=draw_h_pt,
@@ -2155,6 +2579,8 @@ def parse_args():
                    help="Copyright-Name (unten zentriert; leer = kein Copyright)")
     p.add_argument("--version", type=str, help="Versionsstring (unten links)")
     p.add_argument("--out", dest="out_base", type=str, help="Ausgabebasis (ohne .pdf)")
+    p.add_argument("--no-cache", dest="no_cache", action="store_true",
+                   help="Vorverarbeitete Karten nicht über Läufe hinweg behalten (Cache beim Start leeren)")
     return p.parse_args()
 
 def _show_header():
@@ -2241,11 +2667,65 @@ def _collect_all_images_for(layout_key, pairs):
         imgs = [p for (_n,a,b) in pairs for p in (a,b) if p]
     seen, out = set(), []
     for p in imgs:
-        rp = str(Path(p).resolve())
+        rp = _resolved_str(p)
         if rp not in seen:
             seen.add(rp); out.append(Path(p))
     return out
 
+# Unter so vielen (noch nicht vorbereiteten) Bildern lohnt der Start eines Prozess-Pools nicht
+PARALLEL_PREPROCESS_MIN_IMAGES = 8
+# Höchstens so viele Karten pro Pool-Auftrag (kleine Decks: 1, damit alle Kerne etwas bekommen)
+PREPROCESS_CHUNKSIZE = 4
+
+def _preprocess_worker_init(fmt, keep_cache: bool):
+    # Spawn (Windows/EXE) startet mit Modul-Defaults -> aktuelles Kartenformat/Cache-Modus übernehmen
+    global KEEP_PREPROCESS_CACHE
+    KEEP_PREPROCESS_CACHE = keep_cache
+    if fmt:
+        apply_card_format(fmt)
+
+def _preprocess_worker(img_path_str: str, quality_key: str, card_box_inches, crop_bleed: bool):
+    out = _preprocess_card_image_for_pdf(Path(img_path_str), quality_key, card_box_inches, crop_bleed)
+    key = str(out)
+    # JPEGs liegen nur im Speicher des Workers -> Bytes (und die bekannte Pixelgröße) zurückgeben
+    return key, _MEM_JPEG.get(key), _IMG_SIZE_CACHE.get(key)
+
+def _pending_preprocess(img_paths, quality_key, card_box_inches, crop_bleed):
+    return [p for p in img_paths
+            if _preprocess_memo_key(p, quality_key, card_box_inches, crop_bleed) not in _PREPROCESS_MEMO]
+
+def _preprocess_parallel(img_paths, quality_key, card_box_inches, crop_bleed, on_done=None) -> None:
+    """
+    Bereitet die Bilder in einem Prozess-Pool vor (Pillow-Arbeit auf allen Kernen) und legt die
+    Ergebnisse in die Caches des Hauptprozesses. Bei Problemen (kein fork/spawn möglich o. ä.)
+    einfach zurück – der Aufrufer erledigt den Rest seriell.
+    """
+    todo = _pending_preprocess(img_paths, quality_key, card_box_inches, crop_bleed)
+    workers = min(len(todo), os.cpu_count() or 1)
+    if Image is None or workers < 2 or len(todo) < PARALLEL_PREPROCESS_MIN_IMAGES:
+        return
+    try:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_preprocess_worker_init,
+                                 initargs=(STATE["current_format"], KEEP_PREPROCESS_CACHE)) as ex:
+            # Mehrere Karten je Auftrag: weniger Pickle/IPC-Rundläufe pro Bild bei großen Decks
+            n = len(todo)
+            results = ex.map(
+                _preprocess_worker,
+                [str(p) for p in todo], [quality_key] * n, [tuple(card_box_inches)] * n, [crop_bleed] * n,
+                chunksize=max(1, min(PREPROCESS_CHUNKSIZE, n // (workers * 4)))
+            )
+            for p, (out, data, size) in zip(todo, results):
+                if data is not None:
+                    _MEM_JPEG[out] = data
+                if size is not None:
+                    _IMG_SIZE_CACHE[out] = size
+                _PREPROCESS_MEMO[_preprocess_memo_key(p, quality_key, card_box_inches, crop_bleed)] = Path(out)
+                if on_done:
+                    on_done()
+    except Exception:
+        pass
+
 def warmup_preprocessing(img_paths, quality_key, card_box_inches, crop_bleed):
     # Optionales Vorwärmen (zeigt Fortschritt); Zeichnen nutzt dann Cache
     if not img_paths:
@@ -2253,7 +2733,8 @@ def warmup_preprocessing(img_paths, quality_key, card_box_inches, crop_bleed):
 
     # Kein rich installiert oder kein Progress verfügbar -> stilles Warm-Up
     if (rprint is None) or (Progress is None):
-        for p in img_paths:
+        _preprocess_parallel(img_paths, quality_key, card_box_inches, crop_bleed)
+        for p in _pending_preprocess(img_paths, quality_key, card_box_inches, crop_bleed):
             preprocess_card_image_for_pdf(p, quality_key, card_box_inches, crop_bleed=crop_bleed)
         return
 
@@ -2266,8 +2747,12 @@ def warmup_preprocessing(img_paths, quality_key, card_box_inches, crop_bleed):
             TimeRemainingColumn(),
             transient=True
         ) as progress:
-            task = progress.add_task("Bilder vorbereiten…", total=len(img_paths))
-            for p in img_paths:
+            pending = _pending_preprocess(img_paths, quality_key, card_box_inches, crop_bleed)
+            task = progress.add_task("Bilder vorbereiten…", total=len(pending))
+            _preprocess_parallel(pending, quality_key, card_box_inches, crop_bleed,
+                                 on_done=lambda: progress.advance(task))
+            # Rest (bzw. alles, wenn kein Pool) seriell
+            for p in _pending_preprocess(pending, quality_key, card_box_inches, crop_bleed):
                 preprocess_card_image_for_pdf(p, quality_key, card_box_inches, crop_bleed=crop_bleed)
                 progress.advance(task)
     except Exception:
@@ -2378,13 +2863,19 @@ def draw_bottom_line(c: canvas.Canvas, page_w: float,
 
 def _fit_image_into_box_rotated(img_path: Path, box_w: float, box_h: float, rotate_deg: int) -> Tuple[float, float]:
     """Return draw_w, draw_h after rotation so that rotated image fits into box."""
+    key = (str(img_path), box_w, box_h, rotate_deg % 360)
+    fit = _FIT_CACHE.get(key)
+    if fit is None:
+        fit = _FIT_CACHE[key] = _compute_fit_rotated(img_path, box_w, box_h, key[3])
+    return fit
+
+def _compute_fit_rotated(img_path: Path, box_w: float, box_h: float, r: int) -> Tuple[float, float]:
     size = get_image_px_size(img_path)
     if not size:
         return box_w, box_h
     iw, ih = size
     if iw <= 0 or ih <= 0:
         return box_w, box_h
-    r = rotate_deg % 360
     if r in (90, 270):
         # rotated dims: w = ih, h = iw
         scale = min(box_w / ih, box_h / iw)
@@ -2393,6 +2884,20 @@ def _fit_image_into_box_rotated(img_path: Path, box_w: float, box_h: float, rota
     return iw * scale, ih * scale
 
 
+# Linearteil von scale(±1, 1) · rotate(θ) je (Drehung, Spiegelung); nur die Translation ist pro Karte neu
+_ROT_MIRROR_MATRIX: Dict[Tuple[int, bool], Tuple[float, float, float, float]] = {}
+
+def _rot_mirror_matrix(rotate_deg: int, mirror_x: bool) -> Tuple[float, float, float, float]:
+    key = (rotate_deg, mirror_x)
+    m = _ROT_MIRROR_MATRIX.get(key)
+    if m is None:
+        rad = math.radians(rotate_deg)
+        # runden, damit 90°/180°/270° exakte 0/±1 liefern
+        cos_t, sin_t = round(math.cos(rad), 12), round(math.sin(rad), 12)
+        sx = -1.0 if mirror_x else 1.0
+        m = _ROT_MIRROR_MATRIX[key] = (sx * cos_t, sin_t, -sx * sin_t, cos_t)
+    return m
+
 def draw_image_transformed(
     c: canvas.Canvas,
     img_path: Path,
@@ -2403,24 +2908,36 @@ def draw_image_transformed(
 ):
     """Draw image centered in box; mirror_x is applied in page X axis (good for gutter folding)."""
     draw_w, draw_h = _fit_image_into_box_rotated(img_path, box_w, box_h, rotate_deg)
-    cx = x + box_w / 2.0
-    cy = y + box_h / 2.0
+    if rotate_deg % 360 == 0 and not mirror_x:
+        # Vorderseiten: kein q/cm/Q-Block nötig, direkt zentriert zeichnen
+        c.drawImage(get_image_reader(img_path), x + (box_w - draw_w) / 2.0, y + (box_h - draw_h) / 2.0,
+                    width=draw_w, height=draw_h, preserveAspectRatio=True, mask="auto")
+        return
+    # 180° (Gutterfold-Rückseiten) bleibt eine Matrix im Content-Stream statt eines in Pillow gedrehten
+    # Zweitbildes: kein zusätzliches Encode und dieselbe Bilddatei wie in den anderen Layouts
+    a, b, cc, d = _rot_mirror_matrix(rotate_deg, mirror_x)
     c.saveState()
-    c.translate(cx, cy)
-    if mirror_x:
-        c.scale(-1, 1)
-    if rotate_deg:
-        c.rotate(rotate_deg)
-    c.drawImage(ImageReader(str(img_path)), -draw_w / 2.0, -draw_h / 2.0,
+    # entspricht translate(Mitte) -> scale(-1, 1) -> rotate(rotate_deg), aber als EIN cm-Operator
+    c.transform(a, b, cc, d, x + box_w / 2.0, y + box_h / 2.0)
+    c.drawImage(get_image_reader(img_path), -draw_w / 2.0, -draw_h / 2.0,
                 width=draw_w, height=draw_h, preserveAspectRatio=True, mask="auto")
     c.restoreState()
 
+# Schnittmarkenfarbe je INI-Wert nur einmal parsen: setStrokeColor() mit einem String
+# ruft jedes Mal colors.toColor() auf.
+_COLOR_CACHE: Dict[str, Color] = {}
+
+def cutmark_color() -> Color:
+    col = _COLOR_CACHE.get(CUTMARK_COLOR)
+    if col is None:
+        col = _COLOR_CACHE[CUTMARK_COLOR] = colors.toColor(CUTMARK_COLOR)
+    return col
+
 def draw_gutterfold_line_horizontal(c: canvas.Canvas, x: float, y: float, w: float):
     c.saveState()
     c.setLineWidth(GF_FOLD_LINE_WIDTH)
     if GF_FOLD_LINE_DASH:
         c.setDash(GF_FOLD_LINE_DASH[0], GF_FOLD_LINE_DASH[1])
-    from reportlab.lib.colors import black
     c.setStrokeColor(black)
     c.line(x, y, x + w, y)
     c.restoreState()
@@ -2437,11 +2954,32 @@ def draw_gutter_bridge_marks(
     """
     c.saveState()
     c.setLineWidth(CUTMARK_LINE_PT_STD)
-    c.setStrokeColor(CUTMARK_COLOR)
+    c.setStrokeColor(cutmark_color())
+    p = c.beginPath()
     for x in x_positions:
-        c.line(x, y_gutter_bottom, x, y_gutter_top)
+        p.moveTo(x, y_gutter_bottom); p.lineTo(x, y_gutter_top)
+    c.drawPath(p, stroke=1, fill=0)
     c.restoreState()
     
+# Form-Name je Geometrie/Markeneinstellung: pro Seite nur ein Dict-Lookup statt repr()+md5
+_MARKS_FORM_NAMES: Dict[tuple, str] = {}
+
+def draw_marks_form(c: canvas.Canvas, key: tuple, draw) -> None:
+    """
+    Schnittmarken sind auf jeder Seite eines Layouts identisch: beim ersten Mal als
+    Form-XObject anlegen, danach nur noch per doForm referenzieren (Pfade einmal im PDF).
+    """
+    key = key + (CUTMARK_LEN_PT_STD, CUTMARK_LINE_PT_STD, CUTMARK_LEN_PT_BLEED, CUTMARK_LINE_PT_BLEED,
+                 str(CUTMARK_COLOR))
+    name = _MARKS_FORM_NAMES.get(key)
+    if name is None:
+        name = _MARKS_FORM_NAMES[key] = "marks_" + hashlib.md5(repr(key).encode("utf-8")).hexdigest()[:16]
+    if not c.hasForm(name):
+        c.beginForm(name)
+        draw(c)
+        c.endForm()
+    c.doForm(name)
+
 def cutmarks_enabled_standard() -> bool:
     """Standard/Gutterfold cut marks are enabled only if length AND line width are > 0."""
     return (CUTMARK_LEN_PT_STD > 0.0) and (CUTMARK_LINE_PT_STD > 0.0)
@@ -2460,21 +2998,24 @@ def draw_cutmarks_gutterfold(
     """Outside-only crop marks (similar visual style to your 2x3 outer marks)."""
     c.saveState()
     c.setLineWidth(CUTMARK_LINE_PT_STD)
-    c.setStrokeColor(CUTMARK_COLOR)
+    c.setStrokeColor(cutmark_color())
     L = CUTMARK_LEN_PT_STD
     x_left = x0
     x_right = x0 + grid_w
     y_bottom = y0
     y_top = y0 + grid_h
 
+    # Alle Marken in EINEM Pfad -> ein Stroke-Operator statt einem pro Linie
+    p = c.beginPath()
     for y in y_edges:
-        c.line(x_left - L, y, x_left, y)
-        c.line(x_right, y, x_right + L, y)
+        p.moveTo(x_left - L, y); p.lineTo(x_left, y)
+        p.moveTo(x_right, y);    p.lineTo(x_right + L, y)
 
     for x in x_marks:
-        c.line(x, y_bottom - L, x, y_bottom)
-        c.line(x, y_top, x, y_top + L)
+        p.moveTo(x, y_bottom - L); p.lineTo(x, y_bottom)
+        p.moveTo(x, y_top);        p.lineTo(x, y_top + L)
 
+    c.drawPath(p, stroke=1, fill=0)
     c.restoreState()
 
 # =========================================================
@@ -2483,20 +3024,22 @@ def draw_cutmarks_gutterfold(
 def draw_inner_crosses_grid(c: canvas.Canvas, x0: float, y0: float, card_w: float, card_h: float, cols: int, rows: int):
     c.saveState()
     c.setLineWidth(CUTMARK_LINE_PT_STD)
-    c.setStrokeColor(CUTMARK_COLOR)
+    c.setStrokeColor(cutmark_color())
     half = CUTMARK_LEN_PT_STD / 2.0
     xs = [x0 + j * card_w for j in range(1, cols)]
     ys = [y0 + i * card_h for i in range(1, rows)]
+    p = c.beginPath()
     for x in xs:
         for y in ys:
-            c.line(x - half, y, x + half, y)
-            c.line(x, y - half, x, y + half)
+            p.moveTo(x - half, y); p.lineTo(x + half, y)
+            p.moveTo(x, y - half); p.lineTo(x, y + half)
+    c.drawPath(p, stroke=1, fill=0)
     c.restoreState()
 
 def draw_outer_marks_grid(c: canvas.Canvas, x0: float, y0: float, card_w: float, card_h: float, cols: int, rows: int):
     c.saveState()
     c.setLineWidth(CUTMARK_LINE_PT_STD)
-    c.setStrokeColor(CUTMARK_COLOR)
+    c.setStrokeColor(cutmark_color())
     half = CUTMARK_LEN_PT_STD / 2.0
     grid_w = cols * card_w
     grid_h = rows * card_h
@@ -2506,22 +3049,24 @@ def draw_outer_marks_grid(c: canvas.Canvas, x0: float, y0: float, card_w: float,
     y_top = y0 + grid_h
     x_left = x0
     x_right = x0 + grid_w
+    p = c.beginPath()
     for x in xs:
-        c.line(x, y_bottom - half, x, y_bottom + half)
-        c.line(x, y_top    - half, x, y_top    + half)
-        c.line(x - half, y_bottom, x + half, y_bottom)
-        c.line(x - half, y_top,    x + half, y_top)
+        p.moveTo(x, y_bottom - half); p.lineTo(x, y_bottom + half)
+        p.moveTo(x, y_top    - half); p.lineTo(x, y_top    + half)
+        p.moveTo(x - half, y_bottom); p.lineTo(x + half, y_bottom)
+        p.moveTo(x - half, y_top);    p.lineTo(x + half, y_top)
     for y in ys:
-        c.line(x_left  - half, y, x_left  + half, y)
-        c.line(x_right - half, y, x_right + half, y)
-        c.line(x_left,  y - half, x_left,  y + half)
-        c.line(x_right, y - half, x_right, y + half)
+        p.moveTo(x_left  - half, y); p.lineTo(x_left  + half, y)
+        p.moveTo(x_right - half, y); p.lineTo(x_right + half, y)
+        p.moveTo(x_left,  y - half); p.lineTo(x_left,  y + half)
+        p.moveTo(x_right, y - half); p.lineTo(x_right, y + half)
+    c.drawPath(p, stroke=1, fill=0)
     c.restoreState()
 
 def draw_corner_marks_grid(c: canvas.Canvas, x0: float, y0: float, card_w: float, card_h: float, cols: int, rows: int):
     c.saveState()
     c.setLineWidth(CUTMARK_LINE_PT_STD)
-    c.setStrokeColor(CUTMARK_COLOR)
+    c.setStrokeColor(cutmark_color())
     half = CUTMARK_LEN_PT_STD / 2.0
     grid_w = cols * card_w
     grid_h = rows * card_h
@@ -2529,11 +3074,33 @@ def draw_corner_marks_grid(c: canvas.Canvas, x0: float, y0: float, card_w: float
     x_right = x0 + grid_w
     y_bottom = y0
     y_top = y0 + grid_h
+    p = c.beginPath()
     for (x, y) in ((x_left, y_bottom), (x_right, y_bottom), (x_left, y_top), (x_right, y_top)):
-        c.line(x - half, y, x + half, y)
-        c.line(x, y - half, x, y + half)
+        p.moveTo(x - half, y); p.lineTo(x + half, y)
+        p.moveTo(x, y - half); p.lineTo(x, y + half)
+    c.drawPath(p, stroke=1, fill=0)
     c.restoreState()
 
+# Zellen (row, col, x, y) je Rastergeometrie: für alle Seiten eines Layouts gleich
+_GRID_CELLS: Dict[tuple, List[Tuple[int, int, float, float]]] = {}
+
+def grid_cells(x0: float, y0: float, cell_w: float, cell_h: float, cols: int, rows: int,
+               is_back: bool) -> List[Tuple[int, int, float, float]]:
+    """
+    (row, col, x, y) je Index: row==0 visuell OBEN, Rückseite mit gespiegelten Spalten
+    (Short-edge Duplex). Einmal je Geometrie berechnet statt pro Karte und Seite.
+    """
+    key = (x0, y0, cell_w, cell_h, cols, rows, is_back)
+    cells = _GRID_CELLS.get(key)
+    if cells is None:
+        cells = _GRID_CELLS[key] = []
+        for idx in range(cols * rows):
+            row, col = divmod(idx, cols)
+            if is_back:
+                col = (cols - 1) - col
+            cells.append((row, col, x0 + col * cell_w, y0 + (rows - 1 - row) * cell_h))
+    return cells
+
 def _compute_enclosing_edges(img_paths, cols, rows, is_back=False):
     """
     Ermittelt für ein (teilweise belegtes) Grid die umschließenden Kanten
@@ -2547,7 +3114,7 @@ def _compute_enclosing_edges(img_paths, cols, rows, is_back=False):
 
     for idx in range(min(len(img_paths), per_page)):
         p = img_paths[idx]
-        if p is None or (hasattr(p, "exists") and not p.exists()):
+        if not image_exists(p):
             continue
         row = idx // cols
         col = idx % cols
@@ -2604,27 +3171,16 @@ def place_images_grid_inner(
     # NEU: Occupancy-Matrix zur Prüfung „ist die Zelle darunter belegt?“
     occ = [[False] * cols for _ in range(rows)]
     for idx, p in enumerate(img_paths[:per_page]):
-        if p and p.exists():
+        if image_exists(p):
             r = idx // cols
             ccol = idx % cols
             if is_back:
                 ccol = (cols - 1) - ccol
             occ[r][ccol] = True
 
-    # Zeichenschleife über alle (theoretischen) Zellen der Seite
-    for idx in range(per_page):
-        img_path = img_paths[idx] if idx < len(img_paths) else None
-        row = idx // cols
-        col = idx % cols
-        # Rückseite: Spalten spiegeln (Short-edge Duplex Verhalten)
-        if is_back:
-            col = (cols - 1) - col
-
-        x = x0 + col * card_w
-        # y top-down: row==0 visuell OBEN, row==rows-1 UNTEN
-        y = y0 + (rows - 1 - row) * card_h
-
-        if img_path is None or not img_path.exists():
+    # Zeichenschleife über die belegten Zellen der Seite (Rückseite: Spalten gespiegelt)
+    for img_path, (row, col, x, y) in zip(img_paths, grid_cells(x0, y0, card_w, card_h, cols, rows, is_back)):
+        if not image_exists(img_path):
             continue
 
         # --- Außen-Bleed nur an den 'logischen' Rasteraußenkanten ---
@@ -2668,7 +3224,7 @@ def place_images_grid_inner(
                 dy = y - s * keep_bottom
                 # preserveAspectRatio=False, da wir die exakten Maße vorgeben
                 c.drawImage(
-                    ImageReader(str(processed)),
+                    get_image_reader(processed),
                     dx, dy,
                     width=total_w, height=total_h,
                     preserveAspectRatio=False, mask="auto"
@@ -2680,7 +3236,7 @@ def place_images_grid_inner(
                 dx = x + (card_w - draw_w) / 2.0
                 dy = y + (card_h - draw_h) / 2.0
                 c.drawImage(
-                    ImageReader(str(processed)),
+                    get_image_reader(processed),
                     dx, dy,
                     width=draw_w, height=draw_h,
                     preserveAspectRatio=True, mask="auto"
@@ -2692,7 +3248,7 @@ def place_images_grid_inner(
             dx = x + (card_w - draw_w) / 2.0
             dy = y + (card_h - draw_h) / 2.0
             c.drawImage(
-                ImageReader(str(processed)),
+                get_image_reader(processed),
                 dx, dy,
                 width=draw_w, height=draw_h,
                 preserveAspectRatio=True, mask="auto"
@@ -2700,9 +3256,11 @@ def place_images_grid_inner(
 
     # Marken nur zeichnen, wenn via INI aktiv (Länge und Linienbreite > 0)
     if cutmarks_enabled_standard():
-        draw_inner_crosses_grid(c, x0, y0, card_w, card_h, cols, rows)
-        draw_outer_marks_grid(c, x0, y0, card_w, card_h, cols, rows)
-        draw_corner_marks_grid(c, x0, y0, card_w, card_h, cols, rows)
+        def _marks(c):
+            draw_inner_crosses_grid(c, x0, y0, card_w, card_h, cols, rows)
+            draw_outer_marks_grid(c, x0, y0, card_w, card_h, cols, rows)
+            draw_corner_marks_grid(c, x0, y0, card_w, card_h, cols, rows)
+        draw_marks_form(c, ("standard", x0, y0, card_w, card_h, cols, rows), _marks)
 
 # =========================================================
 # Layout 2x3: landscape, outer cut marks ONLY for poker cutlines
@@ -2733,7 +3291,7 @@ def draw_cutmarks_bleed_outer_only(c: canvas.Canvas,
     """
     c.saveState()
     c.setLineWidth(CUTMARK_LINE_PT_BLEED)
-    c.setStrokeColor(CUTMARK_COLOR)
+    c.setStrokeColor(cutmark_color())
     grid_w = cols * box_w
     grid_h = rows * box_h
     x_left = x0
@@ -2741,31 +3299,24 @@ def draw_cutmarks_bleed_outer_only(c: canvas.Canvas,
     y_bottom = y0
     y_top = y0 + grid_h
 
-    # Fractions of poker cutlines within ONE bleed box
-    fx_left  = BLEED_LEFT_TOP_PX / BLEED_W_PX
-    fx_right = (BLEED_LEFT_TOP_PX + INNER_W_PX) / BLEED_W_PX
-    fy_bottom = BLEED_RIGHT_BOTTOM_PX / BLEED_H_PX
-    fy_top    = (BLEED_RIGHT_BOTTOM_PX + INNER_H_PX) / BLEED_H_PX
+    # Fractions of poker cutlines within ONE bleed box (precomputed per card format)
+    fx_left, fx_right, fy_bottom, fy_top = BLEED_CUT_FRAC
 
-    x_cuts = []
-    for j in range(cols):
-        box_left = x0 + j * box_w
-        x_cuts.append(box_left + fx_left  * box_w)
-        x_cuts.append(box_left + fx_right * box_w)
-
-    y_cuts = []
-    for i in range(rows):
-        box_bottom = y0 + i * box_h
-        y_cuts.append(box_bottom + fy_bottom * box_h)
-        y_cuts.append(box_bottom + fy_top    * box_h)
+    # Schnittlinien-Offsets innerhalb EINER Box sind für alle Boxen gleich -> einmal rechnen
+    x_offs = (fx_left * box_w, fx_right * box_w)
+    y_offs = (fy_bottom * box_h, fy_top * box_h)
+    x_cuts = [x0 + j * box_w + off for j in range(cols) for off in x_offs]
+    y_cuts = [y0 + i * box_h + off for i in range(rows) for off in y_offs]
 
     L = CUTMARK_LEN_PT_BLEED
+    p = c.beginPath()
     for x in x_cuts:
-        c.line(x, y_bottom - L, x, y_bottom)
-        c.line(x, y_top,       x, y_top + L)
+        p.moveTo(x, y_bottom - L); p.lineTo(x, y_bottom)
+        p.moveTo(x, y_top);        p.lineTo(x, y_top + L)
     for y in y_cuts:
-        c.line(x_left - L, y, x_left, y)
-        c.line(x_right,   y, x_right + L, y)
+        p.moveTo(x_left - L, y); p.lineTo(x_left, y)
+        p.moveTo(x_right,   y);  p.lineTo(x_right + L, y)
+    c.drawPath(p, stroke=1, fill=0)
     c.restoreState()
 
 def place_images_bleed_grid(c: canvas.Canvas,
@@ -2776,26 +3327,22 @@ def place_images_bleed_grid(c: canvas.Canvas,
                             is_back: bool,
                             quality_key: str,
                             card_box_inches: Tuple[float, float]):
-    per_page = cols * rows
-    for idx, img_path in enumerate(img_paths[:per_page]):
-        row = idx // cols
-        col = idx % cols
-        # Rückseite: Spalten spiegeln (Short-edge Duplex Verhalten wie 2x3)
-        if is_back:
-            col = (cols - 1) - col
-        x = x0 + col * box_w
-        y = y0 + (rows - 1 - row) * box_h
-        if img_path is None or not img_path.exists():
+    # Rückseite: Spalten spiegeln (Short-edge Duplex Verhalten wie 2x3)
+    for img_path, (_row, _col, x, y) in zip(img_paths, grid_cells(x0, y0, box_w, box_h, cols, rows, is_back)):
+        if not image_exists(img_path):
             continue
         processed = preprocess_card_image_for_pdf(img_path, quality_key, card_box_inches, crop_bleed=False)
         draw_w, draw_h = fit_image_into_box(processed, box_w, box_h)
         dx = x + (box_w - draw_w) / 2.0
         dy = y + (box_h - draw_h) / 2.0
-        c.drawImage(ImageReader(str(processed)), dx, dy, width=draw_w, height=draw_h, preserveAspectRatio=True, mask="auto")
+        c.drawImage(get_image_reader(processed), dx, dy, width=draw_w, height=draw_h, preserveAspectRatio=True, mask="auto")
 
     # Bleed-Marken nur zeichnen, wenn via INI aktiv (Länge und Linienbreite > 0)
     if cutmarks_enabled_bleed():
-        draw_cutmarks_bleed_outer_only(c, x0, y0, cols=cols, rows=rows, box_w=box_w, box_h=box_h)
+        draw_marks_form(
+            c, ("bleed", x0, y0, box_w, box_h, cols, rows),
+            lambda c: draw_cutmarks_bleed_outer_only(c, x0, y0, cols=cols, rows=rows, box_w=box_w, box_h=box_h)
+        )
 
 def place_images_gutterfold_grid(
     c: canvas.Canvas,
@@ -2818,7 +3365,7 @@ def place_images_gutterfold_grid(
     for col in range(cols):
         _base, front, back = padded[col]
         used_cols.append(
-            bool(front and front.exists()) or bool(back and back.exists())
+            image_exists(front) or image_exists(back)
         )
 
     first_used_col = next(
@@ -2846,7 +3393,7 @@ def place_images_gutterfold_grid(
         x = x0 + col * card_w
 
         # ---------- FRONT ----------
-        if front and front.exists():
+        if image_exists(front):
             if outer_bleed_keep_px > 0:
                 keep_left  = outer_bleed_keep_px if col == first_used_col else 0
                 keep_right = outer_bleed_keep_px if col == last_used_col  else 0
@@ -2878,7 +3425,7 @@ def place_images_gutterfold_grid(
                 )
 
         # ---------- BACK ----------
-        if back and back.exists():
+        if image_exists(back):
             if outer_bleed_keep_px > 0:
                 keep_left  = outer_bleed_keep_px if col == first_used_col else 0
                 keep_right = outer_bleed_keep_px if col == last_used_col  else 0
@@ -2927,25 +3474,24 @@ def place_images_gutterfold_grid(
     })
 
     if cutmarks_enabled_standard():
-        draw_cutmarks_gutterfold(
-            c,
-            x0=x0,
-            y0=y0,
-            grid_w=grid_w,
-            grid_h=grid_h,
-            y_edges=y_edges,
-            x_marks=x_marks
-        )
-
-        # ------------------------------------------------------------
-        # Brückenmarken im Gutter
-        # ------------------------------------------------------------
+        # Brückenmarken im Gutter: von der Oberkante der unteren bis zur Unterkante der oberen Reihe
         y_gutter_bottom = y0 + card_h
         y_gutter_top = y0 + card_h + fold_gutter
-        bridge_x = [x0 + j * card_w for j in range(cols + 1)]
-        draw_gutter_bridge_marks(
-            c, bridge_x, y_gutter_bottom, y_gutter_top
-        )
+
+        def _marks(c):
+            draw_cutmarks_gutterfold(
+                c,
+                x0=x0,
+                y0=y0,
+                grid_w=grid_w,
+                grid_h=grid_h,
+                y_edges=y_edges,
+                x_marks=x_marks
+            )
+            draw_gutter_bridge_marks(
+                c, x_marks, y_gutter_bottom, y_gutter_top
+            )
+        draw_marks_form(c, ("gutterfold", x0, y0, card_w, card_h, fold_gutter, cols), _marks)
 
 # =========================================================
 # PDF generation
@@ -2977,18 +3523,9 @@ def generate_pdf(layout_key: str,
 
     # --- STANDARD (Innenbilder) ---
     if lk in ("standard", "3x3", "3x4"):
-        
-        def _compute_header_h_for_logo(logo_path, page_w, page_h, margins, grid_top_y):
-            if not logo_path:
-                return 0.0
-            lw, lh = fit_logo_with_constraints(logo_path, LOGO_MAX_W, LOGO_MAX_H)
-            max_header_h = max(0.0, page_h - margins["top"] - grid_top_y - LOGO_GAP_TO_GRID)
-            return min(lh, max_header_h)
-
         card_w, card_h = POKER_W_PT, POKER_H_PT
 
         # Logo IMMER zeichnen, aber NICHT als harte Reserve in der Platzberechnung
-        _apply_logo = bool(logo_path)
         _logo_for_calc = None
         cols, rows, x0, y0, grid_w, grid_h, grid_top_y = compute_max_grid_counts(
             page_w, page_h, card_w, card_h,
@@ -2996,6 +3533,7 @@ def generate_pdf(layout_key: str,
         )
         
         per_page = cols * rows
+        logo_placement = compute_logo_placement(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
         c = existing_canvas or create_pdf_canvas(out_path, pagesize_tuple, author=(copyright_name or ''))
         if draw_rulebook:
             draw_rulebook_pages(c, pagesize_tuple, rulebook_images or [], mode="portrait_pref", force_mode=RULEBOOK_ROTATE_MODE)
@@ -3003,14 +3541,10 @@ def generate_pdf(layout_key: str,
         bottom_y_override = BOTTOM_Y_LETTER_3X3 if pagesize_tuple == letter else None
         
         sheet_no = int(start_sheet_no)
-        for group in chunk(pairs, per_page):
-            sheet_no += 1
-            fronts = [a for (_n, a, _b) in group] + [None] * (per_page - len(group))
-            backs  = [b for (_n, _a, b) in group] + [None] * (per_page - len(group))
-            
+        for sheet_no, (fronts, backs, has_backs) in enumerate(
+                split_sheet_sides(pairs, per_page, include_back_pages), start=sheet_no + 1):
             # If there is no back page at all, drop the 'a' suffix (1,2,3...) instead of (1a,2a,3a...)
-            has_backs_on_this_sheet = include_back_pages and any(p for p in backs if p and p.exists())
-            front_label = f"{sheet_no}a" if has_backs_on_this_sheet else f"{sheet_no}"        
+            front_label = f"{sheet_no}a" if has_backs else f"{sheet_no}"
             
             place_images_grid_inner(
                 c, fronts, x0, y0, card_w, card_h,
@@ -3020,14 +3554,11 @@ def generate_pdf(layout_key: str,
                 outer_bleed_keep_px=outer_bleed_keep_px
             )
             
-            if _apply_logo:
-                header_h = _compute_header_h_for_logo(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
-                if header_h > 1.0:
-                    draw_logo_in_header_band(c, logo_path, page_w, page_h, MARGINS_PT, header_h)
+            draw_logo_in_header_band(c, logo_path, logo_placement)
             draw_bottom_line(c, page_w, copyright_name, version_str, front_label,
                              y_override=bottom_y_override)
             c.showPage()
-            if include_back_pages and any(p for p in backs if p and p.exists()):
+            if has_backs:
                 place_images_grid_inner(
                     c, backs, x0 + BACK_X_OFFSET_PT, y0 + BACK_Y_OFFSET_PT, card_w, card_h,
                     cols=cols, rows=rows, is_back=True,
@@ -3035,10 +3566,7 @@ def generate_pdf(layout_key: str,
                     card_box_inches=(POKER_W_PT/72.0, POKER_H_PT/72.0),
                     outer_bleed_keep_px=outer_bleed_keep_px
                 )   
-                if _apply_logo:
-                    header_h = _compute_header_h_for_logo(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
-                    if header_h > 1.0:
-                        draw_logo_in_header_band(c, logo_path, page_w, page_h, MARGINS_PT, header_h)
+                draw_logo_in_header_band(c, logo_path, logo_placement)
 
                 draw_bottom_line(c, page_w, copyright_name, version_str, f"{sheet_no}b",
                                  y_override=bottom_y_override)
@@ -3049,35 +3577,23 @@ def generate_pdf(layout_key: str,
 
     # --- BLEED (nur Außenmarken) ---
     if lk in ("bleed", "2x3", "2x5"):
-        
-        def _compute_header_h_for_logo(logo_path, page_w, page_h, margins, grid_top_y):
-            if not logo_path:
-                return 0.0
-            lw, lh = fit_logo_with_constraints(logo_path, LOGO_MAX_W, LOGO_MAX_H)
-            max_header_h = max(0.0, page_h - margins["top"] - grid_top_y - LOGO_GAP_TO_GRID)
-            return min(lh, max_header_h)
-        
         box_w, box_h = get_bleed_box_size_pt()
         # Logo IMMER zeichnen, aber NICHT als harte Reserve
-        _apply_logo = bool(logo_path)
         _logo_for_calc = None
         cols, rows, x0, y0, grid_w, grid_h, grid_top_y = compute_max_grid_counts(
             page_w, page_h, box_w, box_h,
             MARGINS_PT, _logo_for_calc, BOTTOM_RESERVED_PT, extra_vertical_pt=0.0
         )
         per_page = cols * rows
+        logo_placement = compute_logo_placement(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
         c = existing_canvas or create_pdf_canvas(out_path, pagesize_tuple, author=(copyright_name or ''))
         if draw_rulebook:
             draw_rulebook_pages(c, pagesize_tuple, rulebook_images or [], mode="landscape_pref", force_mode=RULEBOOK_ROTATE_MODE)
         sheet_no = int(start_sheet_no)
-        for group in chunk(pairs, per_page):
-            sheet_no += 1
-            fronts = [a for (_n, a, _b) in group] + [None] * (per_page - len(group))
-            backs  = [b for (_n, _a, b) in group] + [None] * (per_page - len(group))
-            
+        for sheet_no, (fronts, backs, has_backs) in enumerate(
+                split_sheet_sides(pairs, per_page, include_back_pages), start=sheet_no + 1):
             # If there is no back page at all, drop the 'a' suffix (1,2,3...) instead of (1a,2a,3a...)
-            has_backs_on_this_sheet = include_back_pages and any(p for p in backs if p and p.exists())
-            front_label = f"{sheet_no}a" if has_backs_on_this_sheet else f"{sheet_no}"            
+            front_label = f"{sheet_no}a" if has_backs else f"{sheet_no}"
             
             place_images_bleed_grid(
                 c, fronts, x0, y0, box_w, box_h,
@@ -3087,24 +3603,18 @@ def generate_pdf(layout_key: str,
             )
 
 
-            if _apply_logo:
-                header_h = _compute_header_h_for_logo(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
-                if header_h > 1.0:
-                    draw_logo_in_header_band(c, logo_path, page_w, page_h, MARGINS_PT, header_h)
+            draw_logo_in_header_band(c, logo_path, logo_placement)
             
             draw_bottom_line(c, page_w, copyright_name, version_str, front_label)
             c.showPage()
-            if include_back_pages and any(p for p in backs if p and p.exists()):
+            if has_backs:
                 place_images_bleed_grid(
                     c, backs, x0 + BACK_X_OFFSET_PT, y0 + BACK_Y_OFFSET_PT, box_w, box_h,
                     cols=cols, rows=rows, is_back=True,
                     quality_key=quality_key,
                    card_box_inches=get_bleed_box_inches()
                 )
-                if _apply_logo:
-                    header_h = _compute_header_h_for_logo(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
-                    if header_h > 1.0:
-                        draw_logo_in_header_band(c, logo_path, page_w, page_h, MARGINS_PT, header_h)
+                draw_logo_in_header_band(c, logo_path, logo_placement)
                 draw_bottom_line(c, page_w, copyright_name, version_str, f"{sheet_no}b")
                 c.showPage()
         if save_at_end:
@@ -3113,14 +3623,6 @@ def generate_pdf(layout_key: str,
 
     # --- GUTTERFOLD ---
     if lk in ("gutterfold",):
-        
-        def _compute_header_h_for_logo(logo_path, page_w, page_h, margins, grid_top_y):
-                if not logo_path:
-                    return 0.0
-                lw, lh = fit_logo_with_constraints(logo_path, LOGO_MAX_W, LOGO_MAX_H)
-                max_header_h = max(0.0, page_h - margins["top"] - grid_top_y - LOGO_GAP_TO_GRID)
-                return min(lh, max_header_h)
-        
         card_w, card_h = POKER_W_PT, POKER_H_PT
         gf_extra = GF_FOLD_GUTTER_PT
         # 2 Reihen fix; Spalten dynamisch:
@@ -3151,7 +3653,7 @@ def generate_pdf(layout_key: str,
         c = existing_canvas or create_pdf_canvas(out_path, pagesize_tuple, author=(copyright_name or ''))
         if draw_rulebook:
             draw_rulebook_pages(c, pagesize_tuple, rulebook_images or [], mode="landscape_pref", force_mode=RULEBOOK_ROTATE_MODE)
-        _apply_logo = bool(logo_path)
+        logo_placement = compute_logo_placement(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
         sheet_no = int(start_sheet_no)
         for group in chunk(pairs, per_page):
             sheet_no += 1
@@ -3163,10 +3665,7 @@ def generate_pdf(layout_key: str,
                 outer_bleed_keep_px=outer_bleed_keep_px
             )
             
-            if _apply_logo:
-                header_h = _compute_header_h_for_logo(logo_path, page_w, page_h, MARGINS_PT, grid_top_y)
-                if header_h > 1.0:
-                    draw_logo_in_header_band(c, logo_path, page_w, page_h, MARGINS_PT, header_h)
+            draw_logo_in_header_band(c, logo_path, logo_placement)
             draw_bottom_line(c, page_w, copyright_name, version_str, f"{sheet_no}")
             c.showPage()
         if save_at_end:
@@ -3192,6 +3691,145 @@ def choose_gutterfold_orientation(base_pagesize):
     # Falls beides nicht reicht, nimm die Variante mit mehr Höhe; generate_pdf wird trotzdem sauber aborten.
     return ls if available_h(ls) >= available_h(base_pagesize) else base_pagesize
 
+# =========================================================
+# PDF-Ausgabe: eine Datei je Layout/Papier
+# =========================================================
+def render_layout_pdf(lk_norm: str,
+                      out_path: Path,
+                      pagesize_tuple,
+                      fmt_present: List[int],
+                      fmt_state: Dict[int, Dict[str, object]],
+                      logo_path: Optional[Path],
+                      copyright_name: Optional[str],
+                      version_str: str,
+                      quality_key: str,
+                      rulebook_images: List[Path]) -> Path:
+    """
+    Schreibt EINE Ausgabedatei: Rulebook-Seiten, dann alle Formate nacheinander
+    (Seitenzahlen fortlaufend). Gibt out_path zurück.
+    """
+    c = create_pdf_canvas(out_path, pagesize_tuple, author=(copyright_name or ''))
+    rb_mode = "landscape_pref" if lk_norm in ("bleed", "gutterfold") else "portrait_pref"
+    draw_rulebook_pages(c, pagesize_tuple, rulebook_images or [], mode=rb_mode, force_mode=RULEBOOK_ROTATE_MODE)
+
+    sheet_no = 0
+    for fid in fmt_present:
+        st = fmt_state.get(fid, {})
+        fmt_dict = st.get('fmt') if isinstance(st, dict) else None
+        if not isinstance(fmt_dict, dict):
+            continue
+        apply_card_format(fmt_dict)
+
+        include_back_pages_f = bool(st.get('include_back_pages', True))
+        all_have_bleed_f = bool(st.get('all_have_bleed', False))
+
+        if lk_norm == "bleed":
+            pairs_f = st.get('pairs_bleed')
+        else:
+            pairs_f = st.get('pairs')
+
+        if not isinstance(pairs_f, list) or not pairs_f:
+            continue
+
+        if lk_norm == "standard":
+            outer_keep = OUTER_BLEED_KEEP_PX
+        elif lk_norm == "bleed":
+            outer_keep = 0
+        else:
+            outer_keep = OUTER_BLEED_KEEP_PX if all_have_bleed_f else 0
+
+        sheet_no = generate_pdf(
+            layout_key=lk_norm,
+            out_path=out_path,
+            pagesize_tuple=pagesize_tuple,
+            pairs=pairs_f,
+            logo_path=logo_path,
+            copyright_name=copyright_name,
+            version_str=version_str,
+            quality_key=quality_key,
+            include_back_pages=include_back_pages_f,
+            outer_bleed_keep_px=outer_keep,
+            rulebook_images=[],
+            existing_canvas=c,
+            start_sheet_no=sheet_no,
+            draw_rulebook=False,
+            save_at_end=False
+        )
+
+    c.save()
+    # Decodierte Bilddaten nicht über alle Ausgabedateien hinweg im Speicher halten
+    _IMG_READER_CACHE.clear()
+    return out_path
+
+# Laufzeitwerte aus INI/Sprachauswahl; Spawn-Worker (Windows/EXE) starten sonst mit Modul-Defaults
+_RUNTIME_GLOBALS = (
+    "LANG", "CARD_FORMATS",
+    "CUTMARK_LEN_PT_STD", "CUTMARK_LINE_PT_STD", "CUTMARK_LEN_PT_BLEED", "CUTMARK_LINE_PT_BLEED", "CUTMARK_COLOR",
+    "OUTER_BLEED_KEEP_PX", "BACK_X_OFFSET_PT", "BACK_Y_OFFSET_PT",
+    "CARDBACK_BASENAME", "LOGO_BASENAME", "RULEBOOK_BASENAME", "RULEBOOK_ROTATE_MODE",
+    "KEEP_PREPROCESS_CACHE",
+)
+# Ergebnisse des Warm-Ups -> Worker bereiten keine Karte ein zweites Mal vor
+_SHARED_CACHES = (
+    "_PREPROCESS_MEMO", "_CONVERT_CACHE", "_MEM_JPEG", "_IMG_SIZE_CACHE", "_FIT_CACHE", "_EXISTS_CACHE",
+    "_RESOLVED_CACHE",
+)
+
+# Obergrenze paralleler PDF-Prozesse (Speicher: je Worker eigene Caches + ein PDF im Speicher)
+PARALLEL_PDF_MAX_WORKERS = 4
+
+def _pdf_worker_init(runtime: dict, caches: dict) -> None:
+    globals().update(runtime)
+    for name, data in caches.items():
+        globals()[name].update(data)
+
+def render_layout_pdfs(jobs: List[dict]):
+    """
+    Erzeugt die Ausgabedateien (je Job ein render_layout_pdf-Aufruf) und liefert out_path
+    jeder fertigen Datei. Mehrere Dateien sind unabhängig und CPU-gebunden -> ein Prozess je
+    Datei. Lässt sich kein Pool starten (oder bricht er weg), wird der Rest seriell erzeugt;
+    ein Fehler beim Erzeugen einer Datei wird dagegen sofort weitergereicht.
+    Jeder Worker baut eigene Caches und hält sein PDF bis zum Speichern im Speicher, der
+    Spitzenbedarf wächst also mit der Zahl der Worker -> höchstens PARALLEL_PDF_MAX_WORKERS.
+    Outer-Bleed-Varianten werden nicht im Hauptprozess vorgewärmt; bereiten zwei Worker dieselbe
+    Karte vor, schreiben beide über _save_atomic() (kein halb geschriebenes Bild im TMP_DIR).
+    """
+    done = set()
+    workers = min(len(jobs), os.cpu_count() or 1, PARALLEL_PDF_MAX_WORKERS)
+    if workers >= 2:
+        runtime = {name: globals()[name] for name in _RUNTIME_GLOBALS}
+        caches = {name: globals()[name] for name in _SHARED_CACHES}
+        ex = futures = None
+        try:
+            ex = ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_pdf_worker_init,
+                                     initargs=(runtime, caches))
+            # submit() startet die Worker-Prozesse -> gehört noch zum Pool-Start
+            futures = {ex.submit(render_layout_pdf, **job): i for i, job in enumerate(jobs)}
+        except Exception:
+            # Startfehler des Pools (OSError, NotImplementedError ohne sem_open, ImportError) -> seriell
+            if ex is not None:
+                ex.shutdown(wait=False, cancel_futures=True)
+            ex = None
+        if ex is not None:
+            try:
+                for fut in as_completed(futures):
+                    try:
+                        out_path = fut.result()
+                    except (BrokenProcessPool, pickle.PicklingError):
+                        # Pool kaputt bzw. Job nicht übertragbar -> dieser Job seriell (unten)
+                        continue
+                    # Fehler aus render_layout_pdf selbst laufen normal durch; fertige Jobs
+                    # sind vorher vermerkt und werden nie ein zweites Mal erzeugt
+                    done.add(futures[fut])
+                    yield out_path
+            finally:
+                # Bei einem Fehler nicht erst auf alle übrigen Jobs warten
+                ex.shutdown(wait=True, cancel_futures=True)
+    for i, job in enumerate(jobs):
+        if i not in done:
+            yield render_layout_pdf(**job)
+
 
 # =========================================================
 # Main
@@ -3212,7 +3850,7 @@ def main():
     if getattr(args, "lang", None):  # CLI-Sprache persistieren
         save_lang_to_ini(args.lang)
     prompt_language_if_needed()  # lädt I18N + INI
-    clear_tmp_cache()
+    prepare_tmp_cache(keep=not getattr(args, "no_cache", False))
     _show_header()                             # rich-Header (oder print)
     print(t("startup_license"))
     print(" ")
@@ -3236,7 +3874,7 @@ def main():
     # 2b) NEU: pdfConfig.txt im Kartenordner einlesen (wenn vorhanden)
     # -----------------------------
     cfg_txt = folder / PDF_CONFIG_NAME_DEFAULT
-    cfg = read_pdf_config(cfg_txt) if cfg_txt.exists() and cfg_txt.is_file() else {}
+    cfg = read_pdf_config(cfg_txt) if cfg_txt.is_file() else {}
     use_cfg = bool(cfg)
     # Konsolenhinweis: pdfConfig.txt wird verwendet (mehrsprachig)
     if use_cfg:
@@ -3265,6 +3903,7 @@ def main():
                 return fmt
             print(t('invalid_card_format'))
         # 2) Komfort: questionary
+        questionary = _get_questionary()
         if questionary is not None:
             q_title = t('choose_card_format')
             
@@ -3358,7 +3997,7 @@ def main():
         if cb:
             patched_pairs = []
             for (base, a, b) in pairs_here:
-                if (b is None) or (not b.exists()):
+                if not image_exists(b):
                     patched_pairs.append((base, a, cb))
                 else:
                     patched_pairs.append((base, a, b))
@@ -3396,8 +4035,8 @@ def main():
         apply_card_format(fmt_dict)
         pairs_f = list(pairs_by_format.get(fid, []))
 
-        include_back_pages_f = any((b and b.exists()) for (_base, _a, b) in pairs_f)
-        has_missing_for_gutter = any(not (b and b.exists()) for (_base, _a, b) in pairs_f)
+        include_back_pages_f = any(image_exists(b) for (_base, _a, b) in pairs_f)
+        has_missing_for_gutter = any(not image_exists(b) for (_base, _a, b) in pairs_f)
         if requested_gutter and (not include_back_pages_f or has_missing_for_gutter):
             gutter_ok_all = False
 
@@ -3540,8 +4179,9 @@ def main():
 
     # -----------------------------
     # 10) PDF-Erzeugung (gemischte Formate: Formate nacheinander, Seitenzahlen fortlaufend)
-    #     Es bleibt bei: je Layout/Paper eine eigene Datei.
+    #     Es bleibt bei: je Layout/Paper eine eigene Datei (mehrere Dateien parallel).
     # -----------------------------
+    jobs = []
     for layout_key in layout_keys:
         lk_norm = layout_key.strip().lower()
         if lk_norm in ("3x3", "3x4"):
@@ -3564,60 +4204,25 @@ def main():
             else:
                 layout_suffix = "_gutterfold"
 
-            out_path = (generation_dir / f"{out_base}{suffix}{layout_suffix}.pdf").resolve()
-
-            c = create_pdf_canvas(out_path, pagesize_tuple, author=(copyright_name or ''))
-            rb_mode = "landscape_pref" if lk_norm in ("bleed", "gutterfold") else "portrait_pref"
-            draw_rulebook_pages(c, pagesize_tuple, rulebook_images or [], mode=rb_mode, force_mode=RULEBOOK_ROTATE_MODE)
-
-            sheet_no = 0
-            for fid in fmt_present:
-                st = fmt_state.get(fid, {})
-                fmt_dict = st.get('fmt') if isinstance(st, dict) else None
-                if not isinstance(fmt_dict, dict):
-                    continue
-                apply_card_format(fmt_dict)
-
-                include_back_pages_f = bool(st.get('include_back_pages', True))
-                all_have_bleed_f = bool(st.get('all_have_bleed', False))
-
-                if lk_norm == "bleed":
-                    pairs_f = st.get('pairs_bleed')
-                else:
-                    pairs_f = st.get('pairs')
-
-                if not isinstance(pairs_f, list) or not pairs_f:
-                    continue
-
-                if lk_norm == "standard":
-                    outer_keep = OUTER_BLEED_KEEP_PX
-                elif lk_norm == "bleed":
-                    outer_keep = 0
-                else:
-                    outer_keep = OUTER_BLEED_KEEP_PX if all_have_bleed_f else 0
-
-                sheet_no = generate_pdf(
-                    layout_key=lk_norm,
-                    out_path=out_path,
-                    pagesize_tuple=pagesize_tuple,
-                    pairs=pairs_f,
-                    logo_path=logo_path,
-                    copyright_name=copyright_name,
-                    version_str=version_str,
-                    quality_key=quality_key,
-                    include_back_pages=include_back_pages_f,
-                    outer_bleed_keep_px=outer_keep,
-                    rulebook_images=[],
-                    existing_canvas=c,
-                    start_sheet_no=sheet_no,
-                    draw_rulebook=False,
-                    save_at_end=False
-                )
+            jobs.append(dict(
+                lk_norm=lk_norm,
+                out_path=(generation_dir / f"{out_base}{suffix}{layout_suffix}.pdf").resolve(),
+                pagesize_tuple=pagesize_tuple,
+                fmt_present=fmt_present,
+                fmt_state=fmt_state,
+                logo_path=logo_path,
+                copyright_name=copyright_name,
+                version_str=version_str,
+                quality_key=quality_key,
+                rulebook_images=rulebook_images,
+            ))
 
-            c.save()
-            print(t("done", path=out_path))
+    for out_path in render_layout_pdfs(jobs):
+        print(t("done", path=out_path))
 
 if __name__ == "__main__":
+    # Nötig für den Prozess-Pool der Bildvorbereitung in der PyInstaller-EXE
+    multiprocessing.freeze_support()
     try:
         main()
         # Only pause once at the very end, and only if we did NOT already pause earlier